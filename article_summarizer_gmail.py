@@ -1,36 +1,135 @@
 import requests
 from bs4 import BeautifulSoup
 import json
-import time
-from datetime import datetime
+from datetime import datetime, time as dt_time
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from collections import Counter
 import logging
+import time
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from content_extractor import ContentExtractor
+from extraction_profiles import ProfileRegistry
+from feed_cache import FeedCache
+from feed_schedule import FeedScheduler, parse_feed_hints
+from hf_client import DEFAULT_API_URL as DEFAULT_HF_API_URL, HuggingFaceSummarizer
+from http_client import PooledHTTPClient, read_limited
+from keyword_matcher import KeywordMatcher
+from ollama_client import DEFAULT_BASE_URL as DEFAULT_OLLAMA_URL, OllamaBackend
+from rate_limiter import HostRateLimiter, host_for_url, parse_retry_after
+from scheduler import Scheduler, next_daily, parse_times
+from seen_store import SeenArticleStore
+from near_duplicates import NearDuplicateIndex, simhash
+from content_cleaner import ContentCleaner
+from email_renderer import render_digest
+from mail_delivery import DEFAULT_SMTP_HOST, DEFAULT_SMTP_PORT, MailDelivery
+from subscribers import (BASE_SCORE, SubscriberScorer, default_subscribers, length_bonus,
+                         load_subscribers)
+from summary_cache import SummaryCache
+from text_analysis import AnalysisProfile, AnalyzedDocument, document_frequency, top_terms
+from circuit_breaker import BackendUnavailable
+from summarizer_backends import BackendRegistry, SummarizerBackend
+
 # Load environment variables
 load_dotenv()
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    from extractive_summarizer import ExtractiveSummarizer
+except ImportError:  # NumPy/SciPy not installed: first/middle/last sentence summary
+    ExtractiveSummarizer = None
+
+DEFAULT_PROFILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_profiles.json')
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class GmailArticleSummarizer:
-    def __init__(self, gmail_user: str, gmail_password: str, recipient_email: str):
+    def __init__(self, gmail_user: str, gmail_password: str, recipient_email: str,
+                 max_workers: int = 4, host_rate: float = 0.5, host_burst: int = 2,
+                 cache_dir: str = '.cache', seen_retention_days: float = 30, failed_retry_hours: float = 6,
+                 summary_cache_size: int = 1000, max_page_bytes: int = 5 * 1024 * 1024,
+                 profile_memory: bool = False, profiles_path: str = DEFAULT_PROFILES_PATH,
+                 hf_api_url: str = DEFAULT_HF_API_URL, hf_batch_size: int = 8, hf_timeout: float = 60,
+                 ollama_url: str = DEFAULT_OLLAMA_URL, ollama_model: str = 'llama2',
+                 ollama_concurrency: int = 2, ollama_max_tokens: int = 200, ollama_timeout: float = 30,
+                 quality_floor: int = 2, backend_cooldown: float = 300,
+                 persist_breakers: bool = False, near_duplicate_distance: int = 3,
+                 smtp_host: str = DEFAULT_SMTP_HOST, smtp_port: int = DEFAULT_SMTP_PORT,
+                 smtp_ssl: bool = True, smtp_rate: float = 1.0,
+                 subscribers_path: Optional[str] = None, min_relevance_score: int = BASE_SCORE,
+                 poll_interval: float = 1800, min_poll_interval: float = 300,
+                 max_poll_interval: float = 6 * 3600, keywords: Optional[List[str]] = None):
         """
         Initialize the Gmail Article Summarizer
         
         Args:
             gmail_user: Your Gmail address
             gmail_password: Your Gmail app password (not regular password)
-            recipient_email: Email address to send summaries to
+            recipient_email: Email address to send summaries to (several may be
+                given, separated by commas; each gets their own copy)
+            max_workers: Number of worker threads used by the concurrent workflow
+            host_rate: Requests per second allowed to any single host
+            host_burst: Requests a single host may receive back-to-back
+            cache_dir: Directory for caches that persist between runs
+            seen_retention_days: Days an emailed article is remembered and skipped
+            failed_retry_hours: Hours a page that failed to download or extract (or was
+                too short) is skipped; doubled after each further failure
+            summary_cache_size: Summaries kept in the content-addressed cache
+            max_page_bytes: Article pages larger than this are abandoned mid-download
+            profile_memory: Record peak traced memory per article (tracemalloc is
+                process-wide, so figures are only exact with max_workers=1)
+            profiles_path: JSON file with per-site extraction profiles
+            hf_api_url: Hugging Face model endpoint (point at a stand-in server to test)
+            hf_batch_size: Articles per Hugging Face request; 1 summarizes each
+                article as soon as it is scraped
+            hf_timeout: Seconds to wait for one Hugging Face request
+            ollama_url: Address of a local Ollama server
+            ollama_model: Ollama model used for summaries
+            ollama_concurrency: Ollama generations allowed in flight at once
+            ollama_max_tokens: Token budget after which an Ollama summary is cut off
+            ollama_timeout: Seconds a single Ollama generation may take
+            quality_floor: Summarizer backends below this quality (Hugging Face 3,
+                Ollama 2, rule-based 2, or 1 without NumPy/SciPy) are only used when
+                all others fail
+            backend_cooldown: Seconds a backend's circuit breaker stays open before
+                a trial call (doubled after each failed trial)
+            persist_breakers: Keep circuit breaker state in cache_dir between runs
+            near_duplicate_distance: Articles whose text fingerprints differ in at most
+                this many of 64 bits are treated as copies of one story (-1 disables)
+            smtp_host: SMTP server (point at a local stand-in server to test)
+            smtp_port: SMTP port
+            smtp_ssl: Connect with SSL; otherwise plain SMTP with STARTTLS if offered
+            smtp_rate: Emails sent per second at most
+            subscribers_path: JSON file of subscribers, each with their own keywords
+                and min_score; replaces recipient_email when it lists anyone
+            min_relevance_score: Threshold for recipients without a subscribers file
+                (scores are 5-10, so 5 sends every article)
+            poll_interval: Seconds between daemon-mode polls of a feed with no history
+            min_poll_interval: Shortest interval a busy feed is polled at
+            max_poll_interval: Longest interval a quiet feed backs off to
+            keywords: Keywords that select and score articles (default: a broad
+                tech list); also the keywords of subscribers without their own
         """
         self.gmail_user = gmail_user
         self.gmail_password = gmail_password
         self.recipient_email = recipient_email
+        self.recipients = [address.strip() for address in recipient_email.split(',') if address.strip()]
+        self.max_workers = max(1, max_workers)
+        self.max_page_bytes = max_page_bytes
+        self.profile_memory = profile_memory
         
         # RSS feeds to monitor
         self.rss_feeds = [
@@ -42,7 +141,7 @@ class GmailArticleSummarizer:
         ]
         
         # Keywords to filter content (broader for more articles)
-        self.keywords = [
+        self.keywords = keywords or [
             "tech", "technology", "digital", "online", "web", "internet",
             "software", "app", "mobile", "computer", "data", "cloud",
             "startup", "business", "innovation", "future", "trends",
@@ -51,55 +150,208 @@ class GmailArticleSummarizer:
             "fintech", "healthtech", "edtech"
         ]
         
+        # Who gets which articles: per-subscriber keywords and thresholds, all
+        # scored from one pass over each article
+        self.subscribers = (load_subscribers(subscribers_path, self.keywords, min_relevance_score)
+                            if subscribers_path else [])
+        if not self.subscribers:
+            self.subscribers = default_subscribers(self.recipients, self.keywords, min_relevance_score)
+        self.subscriber_scorer = SubscriberScorer(self.subscribers)
+        
+        # Keyword and phrase lists compiled once; each text is scanned a single time.
+        # Feed links are filtered with every subscriber's keywords
+        self.keyword_matcher = KeywordMatcher(self.keywords + self.subscriber_scorer.vocabulary)
+        self.insight_matcher = KeywordMatcher([
+            'important', 'key', 'significant', 'major', 'breakthrough',
+            'innovation', 'discovery', 'finding', 'result', 'conclusion'
+        ])
+        self.action_matcher = KeywordMatcher(
+            ['should', 'must', 'need', 'will', 'can', 'could', 'would', 'recommend', 'suggest']
+        )
+        
+        # Per-site selectors (compiled once) with a generic single-pass fallback
+        self.profiles = ProfileRegistry.from_file(profiles_path)
+        self.extractor = ContentExtractor()
+        # Whitespace and boilerplate cleanup, compiled once (profiles may add phrases)
+        self.content_cleaner = ContentCleaner()
+        
         # User agent for web scraping
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        
+        # Per-host politeness scheduler (replaces a global sleep between articles)
+        self.rate_limiter = HostRateLimiter(requests_per_second=host_rate, burst=host_burst)
+        
+        # Shared keep-alive connection pools, one pool slot per worker
+        self.http = PooledHTTPClient(pool_size=self.max_workers, headers=self.headers)
+        
+        # ETag / Last-Modified validators and parsed items for each feed
+        self.cache_dir = cache_dir
+        self.feed_cache = FeedCache(os.path.join(cache_dir, 'feed_cache.json'))
+        # Per-feed poll intervals for daemon mode, learned from each feed's updates
+        self.feed_schedule = FeedScheduler(self.feed_cache, default_interval=poll_interval,
+                                           min_interval=min_poll_interval, max_interval=max_poll_interval)
+        
+        # Articles already emailed in earlier runs, and pages that recently
+        # failed, are skipped before any request
+        self.seen_store = SeenArticleStore(os.path.join(cache_dir, 'seen_articles.db'),
+                                           retention_days=seen_retention_days,
+                                           failed_retry_hours=failed_retry_hours)
+        
+        # One SMTP session reused for every email, throttled and retried
+        self.mailer = MailDelivery(gmail_user, gmail_password, host=smtp_host, port=smtp_port,
+                                   use_ssl=smtp_ssl, messages_per_second=smtp_rate)
+        
+        # Fingerprints of emailed articles; syndicated copies under new URLs are dropped
+        self.near_duplicate_distance = near_duplicate_distance
+        self.near_duplicates = NearDuplicateIndex(
+            os.path.join(cache_dir, 'fingerprints.db'), max_distance=near_duplicate_distance,
+            retention_days=seen_retention_days
+        ) if near_duplicate_distance >= 0 else None
+        # Articles kept so far in the current run, by fingerprint and by URL
+        self._run_lock = threading.Lock()
+        self._run_fingerprints = NearDuplicateIndex(max_distance=max(0, near_duplicate_distance))
+        self._run_articles: Dict[str, Dict] = {}
+        # Summaries waiting for the next digest, and articles processed for it
+        self._pending: List[Dict] = []
+        self._processed_count = 0
+        
+        # Summaries keyed by a hash of the article text, shared across URLs
+        self.summary_cache = SummaryCache(os.path.join(cache_dir, 'summary_cache.json'),
+                                          max_entries=summary_cache_size)
+        
+        # Hugging Face Inference API, called with batches of articles
+        # (get a free token from https://huggingface.co/settings/tokens)
+        self.huggingface = HuggingFaceSummarizer(self.http, os.getenv('HUGGINGFACE_TOKEN'),
+                                                 api_url=hf_api_url, batch_size=hf_batch_size,
+                                                 timeout=hf_timeout)
+        
+        # Local Ollama server: health checked once per run, model kept loaded
+        self.ollama = OllamaBackend(self.http, base_url=ollama_url, model=ollama_model,
+                                    max_concurrency=ollama_concurrency,
+                                    max_tokens=ollama_max_tokens, timeout=ollama_timeout)
+        
+        # Summarizer backends, routed by health, quality and rolling latency,
+        # each behind a circuit breaker shared by all articles
+        breaker_path = os.path.join(cache_dir, 'breakers.json') if persist_breakers else None
+        self.backends = BackendRegistry(quality_floor=quality_floor, cooldown=backend_cooldown,
+                                        state_path=breaker_path)
+        self.backends.register(SummarizerBackend('huggingface', self._try_huggingface, quality=3,
+                                                 available=lambda: self.huggingface.available))
+        self.backends.register(SummarizerBackend('ollama', self._try_ollama, quality=2,
+                                                 available=self.ollama.maybe_available,
+                                                 ready=self.ollama.available))
+        # The local TextRank summary is good enough to compete with Ollama;
+        # the heuristic fallback without NumPy/SciPy is not
+        self.extractive = ExtractiveSummarizer() if ExtractiveSummarizer else None
+        
+        # Time spent per analysis step (tokenize, insights, topics, ...) per article
+        self.analysis_profile = AnalysisProfile()
+        # Documents of the run being summarized and how many of them contain each
+        # topic term; set by summarize_articles so topics are weighted across the run
+        self._run_documents: Dict[str, AnalyzedDocument] = {}
+        self._run_term_frequency: Counter = Counter()
+        self.backends.register(SummarizerBackend('rule_based', self._rule_based_summary,
+                                                 quality=2 if self.extractive else 1, in_process=True))
+
+    def close(self):
+        """Release pooled HTTP connections and close persistent stores"""
+        self.http.close()
+        self.mailer.close()
+        self.seen_store.close()
+        if self.near_duplicates is not None:
+            self.near_duplicates.close()
+
+    def _fetch(self, url: str, max_retries: int = 2, **kwargs) -> requests.Response:
+        """
+        GET a URL through the per-host rate limiter
+        
+        Honours 429 (and 503 with Retry-After) responses by pausing the host
+        and retrying up to max_retries times.
+        
+        Args:
+            url: The URL to fetch
+            max_retries: Retries allowed after a rate-limited response
+            
+        Returns:
+            The final response
+        """
+        kwargs.setdefault('timeout', 30)
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire(url)
+            response = self.http.get(url, **kwargs)
+            if response.status_code not in (429, 503) or attempt == max_retries:
+                return response
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if response.status_code == 503 and retry_after is None:
+                return response
+            response.close()
+            self.rate_limiter.backoff(url, retry_after)
+        return response
 
     def scrape_article(self, url: str) -> Optional[Dict]:
         """
         Scrape an article from a given URL
         
+        The page is streamed and abandoned as soon as it exceeds max_page_bytes.
+        
         Args:
             url: The URL of the article to scrape
             
         Returns:
             Dictionary containing article data or None if failed
         """
+        if self.profile_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        
         try:
             logger.info(f"Scraping article: {url}")
             
             # Fetch the webpage
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._fetch(url, stream=True)
             response.raise_for_status()
+            body = read_limited(response, self.max_page_bytes)
             
             # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(body, HTML_PARSER)
             
-            # Extract article content (common selectors)
-            title = self._extract_title(soup)
-            content = self._extract_content(soup)
-            author = self._extract_author(soup)
-            date = self._extract_date(soup)
+            # Extract article content with the site's profile, falling back to
+            # the generic single-pass extractor for anything it did not find
+            fields = self._extract_fields(soup, response.url or url)
+            title = fields['title']
+            content = fields['content']
+            author = fields['author']
+            date = fields['date']
             
             if not title or not content:
                 logger.warning(f"Could not extract title or content from {url}")
                 return None
             
             # Clean content
-            content = self._clean_content(content)
+            content = self._clean_content(content, response.url or url)
             
             # Check content length
-            if len(content.split()) < 100:
+            word_count = len(content.split())
+            if word_count < 100:
                 logger.warning(f"Content too short for {url}")
                 return None
             
+            peak_memory = tracemalloc.get_traced_memory()[1] if self.profile_memory else None
+            if peak_memory is not None:
+                logger.info(f"Scraped {len(body) // 1024} KB page, peak memory {peak_memory // 1024} KB")
+            
             return {
                 'url': url,
                 'title': title,
                 'content': content,
+                'word_count': word_count,
                 'author': author,
                 'date': date,
+                'body_bytes': len(body),
+                'peak_memory_bytes': peak_memory,
                 'scraped_at': datetime.now().isoformat()
             }
             
@@ -107,249 +359,267 @@ class GmailArticleSummarizer:
             logger.error(f"Error scraping {url}: {str(e)}")
             return None
 
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract article title"""
-        selectors = ['h1', 'h2', '.title', '.post-title', '.entry-title', '.article-title']
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
-        return None
-
-    def _extract_content(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract main article content"""
-        selectors = [
-            '.entry-content',  # TechCrunch, WordPress sites
-            'main',            # General main content
-            'article',         # Standard article tag
-            '.content',        # Generic content
-            '.post-body',      # Blog posts
-            '.article-body',   # Article content
-            '.post-content',   # Post content
-            '.story-body',     # Story content
-            '.wp-block-post-content',  # WordPress blocks
-            '.article-content' # Article content
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Remove unwanted elements
-                for unwanted in element.select('script, style, nav, header, footer, .ads, .advertisement, .wp-block-buttons, .wp-block-columns'):
-                    unwanted.decompose()
-                
-                text = element.get_text().strip()
-                if len(text) > 100:  # Ensure we got substantial content
-                    return text
-        
-        # Fallback: look for any div with substantial text
-        divs = soup.find_all('div')
-        for div in divs:
-            text = div.get_text().strip()
-            if len(text) > 1000:  # Look for substantial content
-                # Remove unwanted elements
-                for unwanted in div.select('script, style, nav, header, footer'):
-                    unwanted.decompose()
-                return div.get_text().strip()
-        
-        return None
-
-    def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract article author"""
-        selectors = ['.author', '.byline', '.post-author', '.entry-author', '.writer']
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
-        return None
-
-    def _extract_date(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract article date"""
-        selectors = ['.date', '.published-date', '.post-date', '.entry-date', 'time']
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
-        return None
-
-    def _clean_content(self, content: str) -> str:
-        """Clean and format content"""
-        # Remove extra whitespace
-        content = ' '.join(content.split())
-        # Remove common unwanted text
-        unwanted_phrases = [
-            'advertisement', 'sponsored', 'subscribe', 'newsletter',
-            'privacy policy', 'terms of service', 'cookie policy'
-        ]
-        for phrase in unwanted_phrases:
-            content = content.replace(phrase, '')
-        return content
+    def _extract_fields(self, soup: BeautifulSoup, url: str) -> Dict[str, Optional[str]]:
+        """Extract title, content, author and date for a page from the given URL"""
+        profile = self.profiles.for_url(url)
+        if profile:
+            fields = profile.extract(soup)
+            if fields['title'] and fields['content']:
+                return fields
+            logger.info(f"Profile '{profile.name}' incomplete for {url}, using generic extraction")
+            generic = self.extractor.extract(soup)
+            return {field: fields[field] or generic[field] for field in fields}
+        return self.extractor.extract(soup)
+
+    def _clean_content(self, content: str, url: Optional[str] = None) -> str:
+        """Clean and format content, with the boilerplate phrases of the URL's site profile"""
+        profile = self.profiles.for_url(url) if url else None
+        cleaner = profile.cleaner if profile and profile.cleaner else self.content_cleaner
+        return cleaner.clean(content)
 
     def summarize_article_free(self, article_data: Dict) -> Optional[Dict]:
         """
         Summarize article using free AI alternatives
         
+        Articles whose text was summarized before (under any URL) are served
+        from the summary cache without calling any backend. Otherwise the
+        backend registry picks the fastest healthy backend meeting the quality
+        floor and falls through the rest on failure.
+        
         Args:
             article_data: Dictionary containing article information
             
         Returns:
             Dictionary containing summary and insights
         """
+        cached = self._cached_summary(article_data)
+        if cached:
+            return cached
+        
+        # Free AI services: Hugging Face Inference API (free tier), Ollama (if
+        # installed locally) and rule-based summarization as the last resort
+        return self._summarize_with(article_data)
+
+    def summarize_articles(self, articles: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Summarize all articles of a run, sending Hugging Face requests in batches
+        
+        Cached articles are served from the summary cache. The rest go to
+        Hugging Face in batches of hf_batch_size; any article the batch could
+        not summarize is routed through the remaining backends.
+        
+        Args:
+            articles: Article data dictionaries from scrape_article
+            
+        Returns:
+            One summary dictionary (or None) per article, in input order
+        """
+        results = [self._cached_summary(article_data) for article_data in articles]
+        
+        # Identical text under different URLs is only sent once
+        pending: Dict[str, List[int]] = {}
+        for i, result in enumerate(results):
+            if result is None:
+                pending.setdefault(articles[i]['content'], []).append(i)
+        
+        # Tokenize the run once; topic terms common to every article rank lower
+        self._run_documents = {content: self._analyze_document(content) for content in pending}
+        self._run_term_frequency = document_frequency(self._run_documents.values())
+        try:
+            self._summarize_pending(articles, results, pending)
+        finally:
+            self._run_documents = {}
+            self._run_term_frequency = Counter()
+        return results
+
+    def _summarize_pending(self, articles: List[Dict], results: List[Optional[Dict]],
+                           pending: Dict[str, List[int]]):
+        """Fill in results for the uncached articles, batching Hugging Face requests"""
+        # Texts a Hugging Face batch was sent for; only those skip it in the fallback
+        batched = set()
+        if pending and self._batch_huggingface():
+            logger.info(f"Summarizing {len(pending)} articles with Hugging Face "
+                        f"in batches of {self.huggingface.batch_size}")
+            # The breaker is consulted before every batch, so a 429/503 stops the rest
+            for batch in self.huggingface.batches(list(pending)):
+                if not self.backends.acquire('huggingface'):
+                    break
+                start = time.perf_counter()
+                batched.update(batch)
+                try:
+                    summaries = self.huggingface.summarize_batch(batch)
+                except BackendUnavailable as e:
+                    logger.warning(f"Hugging Face unavailable: {str(e)}")
+                    self.backends.record('huggingface', time.perf_counter() - start, False, e)
+                    break
+                per_article = (time.perf_counter() - start) / len(batch)
+                for content, summary in zip(batch, summaries):
+                    self.backends.record('huggingface', per_article, bool(summary))
+                    if not summary:
+                        continue
+                    summary_data = self._huggingface_summary_data(content, summary)
+                    self.summary_cache.put(content, summary_data, 'huggingface')
+                    for i in pending[content]:
+                        results[i] = self._summary_result(articles[i], summary_data, 'huggingface')
+        
+        # Remaining articles run in parallel; OllamaBackend bounds its own concurrency.
+        # Articles Hugging Face already failed on skip it, the rest are routed normally
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing and self.extractive:
+            # Rank the sentences of every remaining article in one matrix computation;
+            # _rule_based_summary then picks up the memoized result
+            try:
+                self.extractive.summarize_many([articles[i]['content'] for i in missing])
+            except Exception as e:
+                # Each article is then summarized on its own as it is routed
+                logger.warning(f"Batched extractive summary failed, summarizing one at a time: {str(e)}")
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                summarized = executor.map(
+                    lambda i: self._summarize_with(
+                        articles[i], exclude=('huggingface',) if articles[i]['content'] in batched else ()),
+                    missing)
+                for i, result in zip(missing, summarized):
+                    results[i] = result
+
+    def _batch_huggingface(self) -> bool:
+        """Return whether Hugging Face is the first routed backend and batching is on"""
+        if self.huggingface.batch_size <= 1:
+            return False
+        first = self.backends.first_ready()
+        return first is not None and first.name == 'huggingface'
+
+    def _cached_summary(self, article_data: Dict) -> Optional[Dict]:
+        """Return the cached summary for an article's text, if there is one"""
+        cached = self.summary_cache.get(article_data['content'])
+        if not cached:
+            return None
+        logger.info(f"Using cached {cached['backend']} summary for: {article_data['title']}")
+        return self._summary_result(article_data, cached['summary_data'], cached['backend'])
+
+    def _summarize_with(self, article_data: Dict, exclude: tuple = ()) -> Optional[Dict]:
+        """Route an article through the backend registry and cache the summary produced"""
         try:
             logger.info(f"Summarizing article: {article_data['title']}")
             
-            # Try different free AI services
-            summary_data = None
-            
-            # Option 1: Try Hugging Face Inference API (free tier)
-            summary_data = self._try_huggingface(article_data)
-            if summary_data:
-                return {
-                    'article_data': article_data,
-                    'summary_data': summary_data,
-                    'summarized_at': datetime.now().isoformat()
-                }
-            
-            # Option 2: Try Ollama (if installed locally)
-            summary_data = self._try_ollama(article_data)
-            if summary_data:
-                return {
-                    'article_data': article_data,
-                    'summary_data': summary_data,
-                    'summarized_at': datetime.now().isoformat()
-                }
-            
-            # Option 3: Fallback to rule-based summarization
-            summary_data = self._rule_based_summary(article_data)
+            routed = self.backends.summarize(article_data, exclude=exclude)
+            if not routed:
+                return None
             
-            return {
-                'article_data': article_data,
-                'summary_data': summary_data,
-                'summarized_at': datetime.now().isoformat()
-            }
+            backend, summary_data = routed
+            self.summary_cache.put(article_data['content'], summary_data, backend)
+            return self._summary_result(article_data, summary_data, backend)
             
         except Exception as e:
             logger.error(f"Error summarizing article: {str(e)}")
             # Fallback to rule-based summary
             try:
                 fallback_summary = self._rule_based_summary(article_data)
-                return {
-                    'article_data': article_data,
-                    'summary_data': fallback_summary,
-                    'summarized_at': datetime.now().isoformat()
-                }
+                return self._summary_result(article_data, fallback_summary, 'rule_based')
             except Exception as fallback_error:
                 logger.error(f"Fallback summarization also failed: {str(fallback_error)}")
                 return None
 
+    def _summary_result(self, article_data: Dict, summary_data: Dict, backend: str) -> Dict:
+        """Wrap summary data in the structure used by run_workflow and send_email"""
+        return {
+            'article_data': article_data,
+            'summary_data': summary_data,
+            'backend': backend,
+            'summarized_at': datetime.now().isoformat()
+        }
+
     def _try_huggingface(self, article_data: Dict) -> Optional[Dict]:
         """Try Hugging Face Inference API (free tier)"""
-        try:
-            # You can get a free API token from https://huggingface.co/settings/tokens
-            hf_token = os.getenv('HUGGINGFACE_TOKEN')
-            if not hf_token:
-                logger.info("No Hugging Face token found, skipping...")
-                return None
-            
-            # Use a free summarization model
-            API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
-            headers = {"Authorization": f"Bearer {hf_token}"}
-            
-            # Prepare content for summarization
-            content = article_data['content'][:1000]  # Limit content length
-            
-            response = requests.post(API_URL, headers=headers, json={"inputs": content})
-            if response.status_code == 200:
-                summary = response.json()[0]['summary_text']
-                
-                # Extract key insights using simple NLP
-                insights = self._extract_key_insights(article_data['content'])
-                
-                return {
-                    'summary': summary,
-                    'key_insights': insights,
-                    'topics': self._extract_topics(article_data['content']),
-                    'takeaways': self._extract_takeaways(article_data['content']),
-                    'relevance_score': self._calculate_relevance_score(article_data['content'])
-                }
-            
-        except Exception as e:
-            logger.warning(f"Hugging Face API failed: {str(e)}")
+        if not self.huggingface.available:
+            logger.info("No Hugging Face token found, skipping...")
+            return None
         
-        return None
+        summary = self.huggingface.summarize([article_data['content']])[0]
+        if not summary:
+            return None
+        return self._huggingface_summary_data(article_data['content'], summary)
+
+    def _huggingface_summary_data(self, content: str, summary: str) -> Dict:
+        """Complete a Hugging Face summary with locally extracted insights"""
+        return self._summary_data(summary, content)
 
     def _try_ollama(self, article_data: Dict) -> Optional[Dict]:
         """Try Ollama (local AI models)"""
-        try:
-            # Check if Ollama is running locally
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
-            if response.status_code == 200:
-                # Use Ollama for summarization
-                content = article_data['content'][:2000]
-                
-                ollama_response = requests.post(
-                    "http://localhost:11434/api/generate",
-                    json={
-                        "model": "llama2",  # or any model you have installed
-                        "prompt": f"Summarize this article in 2-3 sentences:\n\n{content}",
-                        "stream": False
-                    },
-                    timeout=30
-                )
-                
-                if ollama_response.status_code == 200:
-                    summary = ollama_response.json()['response']
-                    
-                    return {
-                        'summary': summary,
-                        'key_insights': self._extract_key_insights(article_data['content']),
-                        'topics': self._extract_topics(article_data['content']),
-                        'takeaways': self._extract_takeaways(article_data['content']),
-                        'relevance_score': self._calculate_relevance_score(article_data['content'])
-                    }
-                    
-        except Exception as e:
-            logger.info("Ollama not available or failed")
+        content = article_data['content'][:2000]
+        summary = self.ollama.summarize(f"Summarize this article in 2-3 sentences:\n\n{content}",
+                                        label=article_data['title'])
+        if not summary:
+            return None
         
-        return None
+        return self._summary_data(summary, article_data['content'])
 
     def _rule_based_summary(self, article_data: Dict) -> Dict:
         """
         Create a summary using rule-based NLP techniques
         This is completely free and doesn't require any API keys
+        
+        With NumPy/SciPy installed the summary is the top TextRank sentences;
+        otherwise the first, middle and last sentences are used.
         """
         content = article_data['content']
-        words = content.split()
+        doc = self._analyze_document(content)
         
-        # Simple extractive summarization
-        sentences = content.split('. ')
-        if len(sentences) > 3:
-            # Take first, middle, and last sentences
-            summary = '. '.join([sentences[0], sentences[len(sentences)//2], sentences[-1]])
-        else:
-            summary = content[:500] + "..." if len(content) > 500 else content
+        with self.analysis_profile.step('summary'):
+            if self.extractive:
+                summary = self.extractive.summarize(content)
+            elif len(doc.sentences) > 3:
+                # Take first, middle, and last sentences
+                sentences = doc.sentences
+                summary = '. '.join([sentences[0], sentences[len(sentences)//2], sentences[-1]])
+            else:
+                summary = content[:500] + "..." if len(content) > 500 else content
         
+        return self._summary_data(summary, content, doc)
+
+    def _analyze_document(self, content: str) -> AnalyzedDocument:
+        """Split, lowercase and count an article once for all analyzers"""
+        doc = self._run_documents.get(content)
+        if doc is not None:
+            return doc
+        with self.analysis_profile.step('tokenize'):
+            return AnalyzedDocument(content)
+
+    def _summary_data(self, summary: str, content: str, doc: Optional[AnalyzedDocument] = None) -> Dict:
+        """
+        Combine a summary with the insights, topics, takeaways and score of the article
+        
+        Every analyzer reads the same AnalyzedDocument; the time spent in each
+        step is added to analysis_profile.
+        """
+        if doc is None:
+            doc = self._analyze_document(content)
+        profile = self.analysis_profile
+        with profile.step('key_insights'):
+            key_insights = self._extract_key_insights(doc)
+        with profile.step('topics'):
+            topics = self._extract_topics(doc)
+        with profile.step('takeaways'):
+            takeaways = self._extract_takeaways(doc)
+        with profile.step('relevance'):
+            relevance_score = self._calculate_relevance_score(doc)
+        profile.count_article()
         return {
             'summary': summary,
-            'key_insights': self._extract_key_insights(content),
-            'topics': self._extract_topics(content),
-            'takeaways': self._extract_takeaways(content),
-            'relevance_score': self._calculate_relevance_score(content)
+            'key_insights': key_insights,
+            'topics': topics,
+            'takeaways': takeaways,
+            'relevance_score': relevance_score
         }
 
-    def _extract_key_insights(self, content: str) -> str:
+    def _extract_key_insights(self, doc: AnalyzedDocument) -> str:
         """Extract key insights using simple NLP"""
         # Look for sentences with key phrases
-        sentences = content.split('. ')
+        sentences = doc.sentences
         insights = []
         
-        key_phrases = [
-            'important', 'key', 'significant', 'major', 'breakthrough',
-            'innovation', 'discovery', 'finding', 'result', 'conclusion'
-        ]
-        
-        for sentence in sentences[:10]:  # Check first 10 sentences
-            if any(phrase in sentence.lower() for phrase in key_phrases):
+        for sentence, lower in zip(sentences[:10], doc.lower_sentences):  # Check first 10 sentences
+            if self.insight_matcher.contains_any(lower):
                 insights.append(sentence.strip())
             if len(insights) >= 3:
                 break
@@ -360,33 +630,20 @@ class GmailArticleSummarizer:
         
         return '\n• '.join([''] + insights)
 
-    def _extract_topics(self, content: str) -> str:
+    def _extract_topics(self, doc: AnalyzedDocument) -> str:
         """Extract main topics from content"""
-        # Simple topic extraction based on frequency
-        words = content.lower().split()
-        word_freq = {}
-        
-        # Count word frequency (excluding common words)
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        
-        for word in words:
-            if len(word) > 3 and word not in common_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Get top 5 most frequent words
-        topics = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
-        return ', '.join([topic[0].title() for topic in topics])
+        # Top 5 normalized, non-stopword terms; during summarize_articles they are
+        # weighted by how few of the run's articles share them
+        topics = top_terms(doc.term_counts, 5, self._run_term_frequency, len(self._run_documents))
+        return ', '.join(topic.title() for topic in topics)
 
-    def _extract_takeaways(self, content: str) -> str:
+    def _extract_takeaways(self, doc: AnalyzedDocument) -> str:
         """Extract actionable takeaways"""
         # Look for action-oriented sentences
-        sentences = content.split('. ')
         takeaways = []
         
-        action_words = ['should', 'must', 'need', 'will', 'can', 'could', 'would', 'recommend', 'suggest']
-        
-        for sentence in sentences:
-            if any(word in sentence.lower() for word in action_words):
+        for sentence, lower in zip(doc.sentences, doc.lower_sentences):
+            if self.action_matcher.contains_any(lower):
                 takeaways.append(sentence.strip())
             if len(takeaways) >= 3:
                 break
@@ -396,135 +653,117 @@ class GmailArticleSummarizer:
         
         return '\n• '.join([''] + takeaways)
 
-    def _calculate_relevance_score(self, content: str) -> int:
+    def _calculate_relevance_score(self, doc: AnalyzedDocument) -> int:
         """Calculate relevance score based on keyword density"""
-        content_lower = content.lower()
-        score = 5  # Base score
+        score = BASE_SCORE
         
-        # Check keyword density
-        for keyword in self.keywords:
-            if keyword in content_lower:
-                score += 1
+        # Check keyword density (one scan; a keyword listed twice still counts twice)
+        counts = self.keyword_matcher.counts(doc.lower)
+        score += sum(1 for keyword in self.keywords if keyword.lower() in counts)
         
         # Check content length (longer articles get higher scores)
-        if len(content.split()) > 1000:
-            score += 1
-        if len(content.split()) > 2000:
-            score += 1
+        score += length_bonus(doc.word_count)
         
         return min(score, 10)  # Cap at 10
 
-    def send_email(self, summaries: List[Dict]) -> bool:
+    def send_digests(self, summaries: List[Dict]) -> List[Dict]:
+        """
+        Send each subscriber the articles scoring at least their threshold
+        
+        Every article is scanned once for all subscribers' keywords; the
+        email shows each subscriber their own relevance score. Subscribers
+        whose digests come out identical share one rendered email.
+        
+        Args:
+            summaries: List of summary dictionaries
+            
+        Returns:
+            The summaries that were sent to at least one subscriber
+        """
+        # Only the lowercased text and the word count counted while scraping are
+        # needed; the articles are not tokenized again
+        articles = [summary['article_data'] for summary in summaries]
+        digests = self.subscriber_scorer.digests(
+            [article['content'].lower() for article in articles],
+            [article.get('word_count') or len(article['content'].split()) for article in articles])
+        skipped = len(self.subscribers) - sum(len(group) for group in digests.values())
+        if skipped:
+            logger.info(f"{skipped} subscriber(s) had no article above their threshold")
+        
+        sent = set()
+        for selection, group in digests.items():
+            personalized = [
+                dict(summaries[i], summary_data=dict(summaries[i]['summary_data'], relevance_score=score))
+                for i, score in selection
+            ]
+            if self.send_email(personalized, [subscriber.email for subscriber in group]):
+                sent.update(i for i, _ in selection)
+        return [summary for i, summary in enumerate(summaries) if i in sent]
+
+    def send_email(self, summaries: List[Dict], recipients: Optional[List[str]] = None) -> bool:
         """
         Send article summaries via Gmail
         
+        The email is rendered once; each recipient gets their own copy over
+        the mailer's shared SMTP session.
+        
         Args:
             summaries: List of summary dictionaries
+            recipients: Addresses to send to (default: the configured recipients)
             
         Returns:
-            True if successful, False otherwise
+            True if at least one recipient was sent the email, False otherwise
         """
+        recipients = self.recipients if recipients is None else recipients
         try:
-            logger.info(f"Sending email with {len(summaries)} article summaries")
+            logger.info(f"Sending email with {len(summaries)} article summaries to {len(recipients)} recipient(s)")
             
             # Create email content
             subject = f"📰 Article Summaries - {datetime.now().strftime('%Y-%m-%d')}"
             
-            # Build HTML email content
-            html_content = f"""
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-                    .article {{ border: 1px solid #ddd; border-radius: 8px; padding: 20px; margin-bottom: 20px; background-color: #fff; }}
-                    .title {{ color: #2c3e50; font-size: 18px; font-weight: bold; margin-bottom: 10px; }}
-                    .meta {{ color: #7f8c8d; font-size: 14px; margin-bottom: 15px; }}
-                    .summary {{ background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin-bottom: 15px; }}
-                    .insights {{ margin-bottom: 15px; }}
-                    .topics {{ color: #3498db; font-weight: bold; }}
-                    .score {{ color: #e74c3c; font-weight: bold; }}
-                    .url {{ color: #3498db; text-decoration: none; }}
-                    .url:hover {{ text-decoration: underline; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>📰 Daily Article Summaries</h1>
-                    <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <p>Found {len(summaries)} relevant articles from tech RSS feeds</p>
-                </div>
-            """
-            
-            for i, summary in enumerate(summaries, 1):
-                article_data = summary['article_data']
-                summary_data = summary['summary_data']
-                
-                html_content += f"""
-                <div class="article">
-                    <div class="title">{i}. {article_data['title']}</div>
-                    <div class="meta">
-                        <strong>Author:</strong> {article_data.get('author', 'Unknown')} | 
-                        <strong>Date:</strong> {article_data.get('date', 'Unknown')} | 
-                        <strong>Relevance Score:</strong> <span class="score">{summary_data['relevance_score']}/10</span>
-                    </div>
-                    
-                    <div class="summary">
-                        <strong>Summary:</strong><br>
-                        {summary_data['summary']}
-                    </div>
-                    
-                    <div class="insights">
-                        <strong>Key Insights:</strong><br>
-                        {summary_data['key_insights']}
-                    </div>
-                    
-                    <div class="insights">
-                        <strong>Main Topics:</strong> <span class="topics">{summary_data['topics']}</span>
-                    </div>
-                    
-                    <div class="insights">
-                        <strong>Actionable Takeaways:</strong><br>
-                        {summary_data['takeaways']}
-                    </div>
-                    
-                    <div class="meta">
-                        <a href="{article_data['url']}" class="url" target="_blank">📖 Read Full Article</a>
-                    </div>
-                </div>
-                """
-            
-            html_content += """
-            </body>
-            </html>
-            """
-            
-            # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.gmail_user
-            msg['To'] = self.recipient_email
-            
-            # Attach HTML content
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-            
-            # Send email
-            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                server.login(self.gmail_user, self.gmail_password)
-                server.send_message(msg)
-            
-            logger.info(f"Successfully sent email to {self.recipient_email}")
-            return True
+            # Build HTML email content (encoded once, shared by every copy)
+            html_part = MIMEText(self._render_email_html(summaries), 'html')
+            
+            messages = []
+            for recipient in recipients:
+                msg = MIMEMultipart('alternative')
+                msg['Subject'] = subject
+                msg['From'] = self.gmail_user
+                msg['To'] = recipient
+                msg.attach(html_part)
+                messages.append(msg)
+            
+            delivered = self.mailer.send_many(messages)
+            sent = [recipient for recipient, ok in zip(recipients, delivered) if ok]
+            if sent:
+                logger.info(f"Successfully sent email to {', '.join(sent)}")
+            if len(sent) < len(recipients):
+                logger.error(f"Email not delivered to {len(recipients) - len(sent)} recipient(s)")
+            return bool(sent)
             
         except Exception as e:
             logger.error(f"Error sending email: {str(e)}")
             return False
 
+    def _render_email_html(self, summaries: List[Dict]) -> str:
+        """
+        Build the HTML body of the summary email
+        
+        Args:
+            summaries: List of summary dictionaries
+            
+        Returns:
+            HTML document as a string
+        """
+        return render_digest(summaries)
+
     def get_articles_from_rss(self, rss_url: str, max_articles: int = 5) -> List[str]:
         """
         Get article URLs from RSS feed
         
+        Sends If-None-Match / If-Modified-Since from the feed cache; a 304
+        response reuses the cached item list without downloading or parsing.
+        
         Args:
             rss_url: URL of the RSS feed
             max_articles: Maximum number of articles to return
@@ -535,97 +774,368 @@ class GmailArticleSummarizer:
         try:
             logger.info(f"Fetching RSS feed: {rss_url}")
             
-            response = requests.get(rss_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'xml')
-            
-            # Find all item tags (articles)
-            items = soup.find_all('item')[:max_articles]
+            response = self._fetch(rss_url, headers=self.feed_cache.conditional_headers(rss_url))
+            if response.status_code == 304:
+                items = self.feed_cache.get_items(rss_url)
+                new_items = 0
+                logger.info(f"RSS feed not modified, reusing {len(items)} cached items")
+            else:
+                response.raise_for_status()
+                items, hints = self._parse_feed(response.content)
+                new_items = self.feed_cache.store(
+                    rss_url, items,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    **hints
+                )
+            self.feed_schedule.record(rss_url, new_items, items)
             
             urls = []
-            for item in items:
-                link = item.find('link')
-                if link and link.get_text():
-                    url = link.get_text().strip()
-                    # Check if URL contains any of our keywords
-                    if any(keyword.lower() in url.lower() for keyword in self.keywords):
-                        urls.append(url)
+            for item in items[:max_articles]:
+                url = item['link']
+                # Check if URL contains any of our keywords
+                if self.keyword_matcher.contains_any(url.lower()):
+                    urls.append(url)
             
             logger.info(f"Found {len(urls)} relevant articles from RSS feed")
             return urls
             
         except Exception as e:
             logger.error(f"Error fetching RSS feed {rss_url}: {str(e)}")
+            self.feed_schedule.record(rss_url, 0, [], failed=True)
             return []
 
-    def run_workflow(self, max_articles: int = 10):
+    def _parse_feed(self, content: bytes) -> Tuple[List[Dict], Dict]:
+        """Parse RSS XML into a list of {'link', 'published'} items and the channel's polling hints"""
+        soup = BeautifulSoup(content, 'xml')
+        
+        items = []
+        for item in soup.find_all('item'):
+            link = item.find('link')
+            if link and link.get_text().strip():
+                published = item.find('pubDate')
+                items.append({
+                    'link': link.get_text().strip(),
+                    'published': published.get_text().strip() if published else None
+                })
+        return items, parse_feed_hints(soup)
+
+    def _claim_article(self, article_data: Dict) -> bool:
         """
-        Run the complete workflow
+        Check a scraped article against the stories already emailed or kept this run
+        
+        A copy of an emailed story is marked seen and dropped. A copy of a story
+        kept earlier in the run is dropped too, and its URL is added to the kept
+        article's 'duplicate_urls' so both are marked seen once it is sent.
         
         Args:
-            max_articles: Maximum number of articles to process
+            article_data: Article data dictionary from scrape_article
+            
+        Returns:
+            Whether the article should be summarized
         """
-        logger.info("Starting Gmail Article Summarizer workflow")
+        if self.near_duplicates is None:
+            return True
+        fingerprint = simhash(article_data['content'])
+        article_data['fingerprint'] = fingerprint
+        if fingerprint is None:
+            return True
         
-        all_urls = []
+        url = article_data['url']
+        sent = self.near_duplicates.find(fingerprint)
+        if sent:
+            logger.info(f"Skipping {url}: near-duplicate of already sent {sent}")
+            self.seen_store.mark_seen([url])
+            return False
         
-        # Get URLs from RSS feeds
-        for rss_feed in self.rss_feeds:
-            urls = self.get_articles_from_rss(rss_feed, max_articles // len(self.rss_feeds))
-            all_urls.extend(urls)
+        with self._run_lock:
+            kept = self._run_fingerprints.find(fingerprint)
+            if kept:
+                logger.info(f"Skipping {url}: near-duplicate of {kept}")
+                self._run_articles[kept].setdefault('duplicate_urls', []).append(url)
+                return False
+            self._run_fingerprints.add(url, fingerprint)
+            self._run_articles[url] = article_data
+        return True
+
+    def _process_article(self, url: str) -> Optional[Dict]:
+        """
+        Scrape and summarize a single article
         
-        # Remove duplicates
-        all_urls = list(set(all_urls))
-        logger.info(f"Total unique articles found: {len(all_urls)}")
+        Args:
+            url: The URL of the article to process
+            
+        Returns:
+            Summary dictionary or None if the article could not be processed
+        """
+        try:
+            # Scrape the article
+            article_data = self.scrape_article(url)
+            if not article_data:
+                self.seen_store.mark_failed([url])
+                return None
+            if not self._claim_article(article_data):
+                return None
+            
+            # Summarize the article (using free methods)
+            logger.info(f"Starting summarization for: {url}")
+            summary_data = self.summarize_article_free(article_data)
+            
+            if not summary_data:
+                logger.warning(f"Failed to summarize article: {url}")
+                return None
+            
+            # Validate summary data structure
+            if 'article_data' not in summary_data or 'summary_data' not in summary_data:
+                logger.error(f"Invalid summary data structure for: {url}")
+                return None
+            
+            return summary_data
+            
+        except Exception as e:
+            logger.error(f"Error processing {url}: {str(e)}")
+            return None
+
+    def poll_feeds(self, max_articles: int = 10, concurrent: bool = True, due_only: bool = False) -> List[Dict]:
+        """
+        Fetch the feeds, then scrape and summarize new articles into the pending digest
         
-        processed_count = 0
-        success_count = 0
-        summaries = []
+        Articles already waiting in the digest are not processed again, and the
+        digest holds at most ``max_articles``; articles beyond that are left for
+        a poll after the digest has been sent. While the digest is full no feed
+        is fetched, so the feeds' adaptive intervals are left as they were.
         
-        for url in all_urls[:max_articles]:
-            try:
-                # Scrape the article
-                article_data = self.scrape_article(url)
-                if not article_data:
-                    continue
-                
-                # Summarize the article (using free methods)
-                logger.info(f"Starting summarization for: {url}")
-                summary_data = self.summarize_article_free(article_data)
-                
-                if not summary_data:
-                    logger.warning(f"Failed to summarize article: {url}")
-                    continue
-                
-                # Validate summary data structure
-                if 'article_data' not in summary_data or 'summary_data' not in summary_data:
-                    logger.error(f"Invalid summary data structure for: {url}")
-                    continue
-                
-                # Add to summaries list
-                summaries.append(summary_data)
-                success_count += 1
-                processed_count += 1
-                
-                # Rate limiting
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing {url}: {str(e)}")
-                continue
+        Args:
+            max_articles: Maximum number of articles in the digest
+            concurrent: Fetch feeds and process articles with a bounded thread
+                pool of ``max_workers`` threads. Set to False (or use
+                ``max_workers=1``) for the original one-at-a-time behaviour.
+            due_only: Only fetch the feeds whose adaptive poll interval has passed
+            
+        Returns:
+            The summaries added to the pending digest
+        """
+        use_pool = concurrent and self.max_workers > 1
+        capacity = max_articles - len(self._pending)
+        if capacity <= 0:
+            # Feeds are left unpolled (and stay due), so an empty poll does not
+            # stretch their adaptive intervals while the digest is full
+            logger.info(f"Digest already holds {len(self._pending)} articles, not polling until it is sent")
+            return []
+        per_feed = max_articles // len(self.rss_feeds)
+        feeds = self.feed_schedule.due(self.rss_feeds) if due_only else self.rss_feeds
+        if not feeds:
+            return []
+        if due_only:
+            logger.info(f"Polling {len(feeds)} of {len(self.rss_feeds)} feeds")
         
-        # Send email with all summaries
-        if summaries:
-            if self.send_email(summaries):
-                logger.info(f"Successfully sent {len(summaries)} summaries via email")
-            else:
-                logger.error("Failed to send email")
+        if use_pool:
+            logger.info(f"Running concurrently with {self.max_workers} workers")
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            run = executor.map
         else:
+            executor = None
+            run = map
+        
+        try:
+            # Get URLs from RSS feeds (results come back in feed order)
+            all_urls = []
+            for urls in run(lambda feed: self.get_articles_from_rss(feed, per_feed), feeds):
+                all_urls.extend(urls)
+            
+            self.feed_cache.save()
+            
+            # Remove duplicates, already-sent and pending articles, keeping
+            # first-seen order so the email is deterministic
+            found_count = len(all_urls)
+            pending = {url for summary in self._pending
+                       for url in [summary['article_data']['url']] + summary['article_data'].get('duplicate_urls', [])}
+            all_urls = [url for url in self.seen_store.filter_unseen(all_urls) if url not in pending]
+            logger.info(f"Total unique new articles found: {len(all_urls)} "
+                        f"(skipped {found_count - len(all_urls)} duplicate, pending or already sent)")
+            
+            # Scrape and summarize; map() yields results in input order. With
+            # Hugging Face batching or the local extractive summarizer, all pages
+            # are scraped first so the whole run is summarized in batches
+            if self.extractive or self._batch_huggingface():
+                scraped = list(run(self.scrape_article, all_urls[:capacity]))
+                self.seen_store.mark_failed(url for url, article in zip(all_urls, scraped) if not article)
+                # Checked in URL order, so the copy kept does not depend on thread timing
+                scraped = [article if article and self._claim_article(article) else None
+                           for article in scraped]
+                summarized = iter(self.summarize_articles([article for article in scraped if article]))
+                results = [next(summarized) if article else None for article in scraped]
+            else:
+                results = list(run(self._process_article, all_urls[:capacity]))
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+        
+        summaries = [summary for summary in results if summary]
+        self._pending.extend(summaries)
+        self._processed_count += len(results)
+        
+        cache_stats = self.summary_cache.stats()
+        logger.info(f"Summary cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                    f"{cache_stats['entries']} entries")
+        self.summary_cache.reset_stats()
+        self.summary_cache.save()
+        return summaries
+    
+    def send_pending(self) -> List[Dict]:
+        """
+        Send the pending digest and start a new one
+        
+        Sent articles are marked seen; articles no subscriber received are
+        dropped from the digest too, and come back through a later poll.
+        
+        Returns:
+            The summaries that were sent to at least one subscriber
+        """
+        summaries, self._pending = self._pending, []
+        # Near-duplicate checks within a digest start over with it
+        with self._run_lock:
+            self._run_fingerprints = NearDuplicateIndex(max_distance=max(0, self.near_duplicate_distance))
+            self._run_articles = {}
+        if not summaries:
             logger.info("No summaries to send")
+            return []
+        
+        # Send each subscriber their digest
+        delivered = self.send_digests(summaries)
+        if delivered:
+            logger.info(f"Successfully sent {len(delivered)} summaries via email")
+            sent = [summary['article_data'] for summary in delivered]
+            self.seen_store.mark_seen(url for article in sent
+                                      for url in [article['url']] + article.get('duplicate_urls', []))
+            if self.near_duplicates is not None:
+                self.near_duplicates.add_many((article['url'], article['fingerprint']) for article in sent
+                                              if article.get('fingerprint') is not None)
+        else:
+            logger.error("No digest was sent")
+        return delivered
+    
+    def _log_stats(self):
+        """Log and reset the per-host, backend, SMTP and analysis counters"""
+        for host, stats in self.rate_limiter.throttle_report().items():
+            logger.info(f"Host {host}: {stats['requests']} requests, "
+                        f"throttled {stats['throttled_seconds']}s, {stats['backoffs']} backoffs")
+        self.rate_limiter.reset_stats()
+        for host, stats in self.http.connection_stats().items():
+            logger.info(f"Host {host}: {stats['requests']} HTTP requests over "
+                        f"{stats['connections']} connections")
+        self.http.reset_stats()
+        ollama_stats = self.ollama.stats()
+        if ollama_stats['generations']:
+            logger.info(f"Ollama: {ollama_stats['generations']} summaries, "
+                        f"avg first token {ollama_stats['avg_first_token_seconds']}s, "
+                        f"avg {ollama_stats['avg_tokens_per_second']} tokens/s, "
+                        f"{ollama_stats['truncated']} cut off at the token budget")
+        self.ollama.reset_stats()
+        for name, stats in self.backends.stats().items():
+            if stats['latency'] is not None or stats['breaker'] != 'closed':
+                logger.info(f"Backend {name}: {stats['latency']}s per article, "
+                            f"{stats['error_rate']:.0%} errors, breaker {stats['breaker']}")
+        self.backends.save()
+        mail_stats = self.mailer.stats()
+        if mail_stats['sent'] or mail_stats['retries']:
+            logger.info(f"SMTP: {mail_stats['sent']} emails over {mail_stats['connections']} connections, "
+                        f"{mail_stats['retries']} retries")
+        self.mailer.reset_stats()
+        if self.analysis_profile.articles:
+            breakdown = ', '.join(f"{step} {ms}ms" for step, ms in self.analysis_profile.report().items())
+            logger.info(f"Analysis per article ({self.analysis_profile.articles} articles): {breakdown}")
+        self.analysis_profile.reset()
+
+    def run_workflow(self, max_articles: int = 10, concurrent: bool = True):
+        """
+        Run the complete workflow
+        
+        Args:
+            max_articles: Maximum number of articles to process
+            concurrent: Fetch feeds and process articles with a bounded thread
+                pool of ``max_workers`` threads. Set to False (or use
+                ``max_workers=1``) for the original one-at-a-time behaviour.
+        """
+        logger.info("Starting Gmail Article Summarizer workflow")
+        self.ollama.reset_health()
+        self._processed_count = 0
+        self.poll_feeds(max_articles, concurrent)
+        processed_count = self._processed_count
+        success_count = len(self._pending)
+        self.send_pending()
+        self._log_stats()
         
         logger.info(f"Workflow completed. Processed: {processed_count}, Success: {success_count}")
 
+    def purge_expired(self):
+        """Forget sent articles and fingerprints older than seen_retention_days"""
+        removed = self.seen_store.purge()
+        if self.near_duplicates is not None:
+            removed += self.near_duplicates.purge()
+        if removed:
+            logger.info(f"Purged {removed} expired sent-article entries")
+
+    def run_daemon(self, digest_times: List[dt_time] = (), max_articles: int = 10,
+                   scheduler: Optional[Scheduler] = None):
+        """
+        Keep running, polling each feed as it comes due and sending digests at set times
+        
+        Every feed is polled on its own schedule (see feed_schedule.py): busy
+        feeds every few minutes, quiet ones backing off to max_poll_interval.
+        
+        The process, and with it the HTTP connection pools, caches, SMTP
+        session and backend circuit breakers, stays up between runs. Returns
+        when the scheduler is stopped (SIGTERM or Ctrl+C when run from main()).
+        
+        Args:
+            digest_times: Local times of day to send the digest (after one last
+                poll); with none, the digest is sent after every poll
+            max_articles: Maximum number of articles per digest
+            scheduler: Scheduler to run on (default: a new one)
+        """
+        scheduler = scheduler or Scheduler()
+        
+        def poll():
+            self.poll_feeds(max_articles, due_only=True)
+            if not digest_times:
+                self.send_pending()
+            self._log_stats()
+            logger.info("Feed poll intervals: " + ', '.join(
+                f"{host_for_url(feed)} {stats['interval_minutes']:g} min "
+                f"({stats['not_modified_rate']:.0%} not modified)"
+                for feed, stats in self.feed_schedule.report(self.rss_feeds).items()))
+        
+        def digest():
+            # Ollama may have come up (or gone away) since the last digest
+            self.ollama.reset_health()
+            self.poll_feeds(max_articles, due_only=True)
+            self.send_pending()
+            self._log_stats()
+        
+        def next_poll(now: float) -> float:
+            due = self.feed_schedule.next_due(self.rss_feeds)
+            if digest_times and len(self._pending) >= max_articles:
+                # A full digest is not polled for; wait until it has been sent
+                due = max(due, next_daily(digest_times, now) + 1)
+            return max(now + 1, due)
+        
+        # Wakes up when the first feed comes due
+        scheduler.add('poll feeds', poll, next_poll, first_due=time.time())
+        scheduler.daily(digest_times, digest, 'send digest')
+        # The stores only purge on open; a long-lived process has to do it itself
+        scheduler.every(24 * 3600, self.purge_expired, 'purge expired articles', run_now=False)
+        logger.info(f"Daemon mode: polling {len(self.rss_feeds)} feeds on adaptive schedules, sending digests "
+                    + (f"at {', '.join(at.strftime('%H:%M') for at in digest_times)}" if digest_times
+                       else "after every poll"))
+        scheduler.run()
+        
+        if self._pending:
+            logger.info(f"Shutting down with {len(self._pending)} unsent articles; later runs will pick them up")
+        self.feed_cache.save()
+        self.summary_cache.save()
+        self.backends.save()
+
 def main():
     """Main function to run the workflow"""
     
@@ -634,12 +1144,15 @@ def main():
     gmail_password = os.getenv('GMAIL_PASSWORD')
     recipient_email = os.getenv('RECIPIENT_EMAIL')
     
-    if not all([gmail_user, gmail_password, recipient_email]):
+    subscribers_path = os.getenv('SUBSCRIBERS_FILE')
+    has_subscribers = bool(subscribers_path) and os.path.exists(subscribers_path)
+    
+    if not all([gmail_user, gmail_password, recipient_email or has_subscribers]):
         print("❌ Missing required environment variables!")
         print("Please set:")
         print("- GMAIL_USER (your Gmail address)")
         print("- GMAIL_PASSWORD (your Gmail app password)")
-        print("- RECIPIENT_EMAIL (where to send summaries)")
+        print("- RECIPIENT_EMAIL (where to send summaries) or SUBSCRIBERS_FILE")
         print("\nOptional (for better AI summaries):")
         print("- HUGGINGFACE_TOKEN (get free from https://huggingface.co/settings/tokens)")
         print("\nNote: This version works completely FREE without any AI API keys!")
@@ -651,10 +1164,80 @@ def main():
         return
     
     # Create the summarizer
-    summarizer = GmailArticleSummarizer(gmail_user, gmail_password, recipient_email)
+    max_workers = int(os.getenv('MAX_WORKERS', '4'))
+    host_rate = float(os.getenv('HOST_RATE_LIMIT', '0.5'))
+    cache_dir = os.getenv('CACHE_DIR', '.cache')
+    seen_retention_days = float(os.getenv('SEEN_RETENTION_DAYS', '30'))
+    failed_retry_hours = float(os.getenv('FAILED_RETRY_HOURS', '6'))
+    summary_cache_size = int(os.getenv('SUMMARY_CACHE_SIZE', '1000'))
+    max_page_bytes = int(os.getenv('MAX_PAGE_BYTES', str(5 * 1024 * 1024)))
+    profile_memory = os.getenv('PROFILE_MEMORY', 'false').lower() == 'true'
+    profiles_path = os.getenv('EXTRACTION_PROFILES', DEFAULT_PROFILES_PATH)
+    hf_api_url = os.getenv('HUGGINGFACE_API_URL', DEFAULT_HF_API_URL)
+    hf_batch_size = int(os.getenv('HF_BATCH_SIZE', '8'))
+    hf_timeout = float(os.getenv('HF_TIMEOUT', '60'))
+    ollama_url = os.getenv('OLLAMA_URL', DEFAULT_OLLAMA_URL)
+    ollama_model = os.getenv('OLLAMA_MODEL', 'llama2')
+    ollama_concurrency = int(os.getenv('OLLAMA_CONCURRENCY', '2'))
+    ollama_max_tokens = int(os.getenv('OLLAMA_MAX_TOKENS', '200'))
+    ollama_timeout = float(os.getenv('OLLAMA_TIMEOUT', '30'))
+    quality_floor = int(os.getenv('SUMMARY_QUALITY_FLOOR', '2'))
+    backend_cooldown = float(os.getenv('BACKEND_COOLDOWN', '300'))
+    persist_breakers = os.getenv('PERSIST_BREAKERS', 'false').lower() == 'true'
+    near_duplicate_distance = int(os.getenv('NEAR_DUPLICATE_DISTANCE', '3'))
+    smtp_host = os.getenv('SMTP_HOST', DEFAULT_SMTP_HOST)
+    smtp_port = int(os.getenv('SMTP_PORT', str(DEFAULT_SMTP_PORT)))
+    smtp_ssl = os.getenv('SMTP_SSL', 'true').lower() == 'true'
+    smtp_rate = float(os.getenv('SMTP_RATE', '1'))
+    min_relevance_score = int(os.getenv('MIN_RELEVANCE_SCORE', '5'))
+    keywords = [keyword.strip() for keyword in os.getenv('CUSTOM_KEYWORDS', '').split(',') if keyword.strip()]
+    daemon_mode = os.getenv('DAEMON_MODE', 'false').lower() == 'true'
+    poll_interval = float(os.getenv('POLL_INTERVAL_MINUTES', '30')) * 60
+    min_poll_interval = float(os.getenv('POLL_MIN_MINUTES', '5')) * 60
+    max_poll_interval = float(os.getenv('POLL_MAX_MINUTES', '360')) * 60
+    digest_times = parse_times(os.getenv('DIGEST_TIMES', ''))
+    summarizer = GmailArticleSummarizer(gmail_user, gmail_password, recipient_email or '',
+                                        max_workers=max_workers, host_rate=host_rate,
+                                        cache_dir=cache_dir,
+                                        seen_retention_days=seen_retention_days,
+                                        failed_retry_hours=failed_retry_hours,
+                                        summary_cache_size=summary_cache_size,
+                                        max_page_bytes=max_page_bytes,
+                                        profile_memory=profile_memory,
+                                        profiles_path=profiles_path,
+                                        hf_api_url=hf_api_url,
+                                        hf_batch_size=hf_batch_size,
+                                        hf_timeout=hf_timeout,
+                                        ollama_url=ollama_url,
+                                        ollama_model=ollama_model,
+                                        ollama_concurrency=ollama_concurrency,
+                                        ollama_max_tokens=ollama_max_tokens,
+                                        ollama_timeout=ollama_timeout,
+                                        quality_floor=quality_floor,
+                                        backend_cooldown=backend_cooldown,
+                                        persist_breakers=persist_breakers,
+                                        near_duplicate_distance=near_duplicate_distance,
+                                        smtp_host=smtp_host,
+                                        smtp_port=smtp_port,
+                                        smtp_ssl=smtp_ssl,
+                                        smtp_rate=smtp_rate,
+                                        subscribers_path=subscribers_path,
+                                        min_relevance_score=min_relevance_score,
+                                        poll_interval=poll_interval,
+                                        min_poll_interval=min_poll_interval,
+                                        max_poll_interval=max_poll_interval,
+                                        keywords=keywords or None)
     
-    # Run the workflow
-    summarizer.run_workflow(max_articles=5)
+    # Run the workflow once, or keep running until SIGTERM/Ctrl+C in daemon mode
+    try:
+        if daemon_mode:
+            scheduler = Scheduler()
+            scheduler.handle_signals()
+            summarizer.run_daemon(digest_times, max_articles=5, scheduler=scheduler)
+        else:
+            summarizer.run_workflow(max_articles=5)
+    finally:
+        summarizer.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass extractor against the original selector cascade
+Runs both on every saved page in a directory and reports time per page and
+whether the extracted fields agree. Pages named after a site with an
+extraction profile (e.g. techcrunch.html) are also timed with that profile.
+
+Usage: python benchmarks/bench_extraction.py [pages_dir] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from article_summarizer_gmail import DEFAULT_PROFILES_PATH, HTML_PARSER
+from content_extractor import ContentExtractor
+from extraction_profiles import ProfileRegistry
+from legacy_extraction import legacy_extract
+
+DEFAULT_PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'articles')
+
+
+def time_extraction(html: bytes, extract, repeat: int):
+    """Return (best seconds, result); parsing happens outside the timed region"""
+    best, result = None, None
+    for _ in range(repeat):
+        soup = BeautifulSoup(html, HTML_PARSER)
+        start = time.perf_counter()
+        result = extract(soup)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('pages_dir', nargs='?', default=DEFAULT_PAGES, help='Directory of saved .html pages')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per page (best time is reported)')
+    args = parser.parse_args()
+
+    pages = sorted(glob.glob(os.path.join(args.pages_dir, '*.html')))
+    if not pages:
+        print(f"❌ No .html pages found in {args.pages_dir}")
+        return
+
+    extractor = ContentExtractor()
+    profiles = ProfileRegistry.from_file(DEFAULT_PROFILES_PATH)
+
+    print(f"{'page':<22}{'legacy ms':>11}{'1-pass ms':>11}{'profile ms':>12}{'speedup':>9}  agreement")
+    totals = [0.0, 0.0]
+    for path in pages:
+        with open(path, 'rb') as f:
+            html = f.read()
+        legacy_time, legacy = time_extraction(html, legacy_extract, args.repeat)
+        single_time, single = time_extraction(html, extractor.extract, args.repeat)
+        totals[0] += legacy_time
+        totals[1] += single_time
+
+        site = os.path.splitext(os.path.basename(path))[0]
+        profile = profiles.for_url(f"https://{site}.com/")
+        profile_column = '-'
+        if profile:
+            profile_time, _ = time_extraction(html, profile.extract, args.repeat)
+            profile_column = f"{profile_time * 1000:.2f}"
+
+        agreement = []
+        for field in ('title', 'author', 'date'):
+            agreement.append(f"{field}={'ok' if legacy[field] == single[field] else 'diff'}")
+        legacy_len, single_len = len(legacy['content'] or ''), len(single['content'] or '')
+        agreement.append(f"content={single_len}/{legacy_len} chars")
+        print(f"{os.path.basename(path):<22}{legacy_time * 1000:>11.2f}{single_time * 1000:>11.2f}"
+              f"{profile_column:>12}{legacy_time / single_time:>8.1f}x  {' '.join(agreement)}")
+
+    print(f"{'total':<22}{totals[0] * 1000:>11.2f}{totals[1] * 1000:>11.2f}{'':>12}{totals[0] / totals[1]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Benchmark each pipeline stage offline against recorded feeds and pages
+Feeds and articles are served by FixtureAdapter, so no network, Gmail account
+or API token is needed. Every stage is timed separately and the results are
+written as JSON; pass --compare with an earlier results file to see the change
+per stage between commits.
+
+With --hf-stub, batched and one-per-article Hugging Face summarization are
+also timed against the local stand-in endpoint in hf_stub_server.py.
+
+Usage: python benchmarks/bench_pipeline.py [--repeat N] [--output FILE] [--compare FILE] [--hf-stub]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from article_summarizer_gmail import GmailArticleSummarizer, HTML_PARSER
+from email_renderer import render_digest
+from feed_cache import FeedCache
+from fixture_transport import FIXTURES_DIR, FixtureAdapter
+from hf_stub_server import start_stub_server
+from near_duplicates import NearDuplicateIndex, simhash
+from summary_cache import SummaryCache
+from text_analysis import AnalyzedDocument
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StageTimer:
+    def __init__(self, repeat: int):
+        """
+        Initialize the timer
+
+        Args:
+            repeat: Runs per call; every run is kept so the median can be reported
+        """
+        self.repeat = max(1, repeat)
+        self.samples: Dict[str, List[float]] = {}
+        self.peak_bytes: Dict[str, List[int]] = {}
+
+    def time(self, stage: str, func: Callable, setup: Callable = None, memory: bool = False):
+        """
+        Time func() repeat times and record the samples under stage
+
+        Args:
+            stage: Name the samples are reported under
+            func: Called with setup()'s result (or no arguments without setup)
+            setup: Untimed preparation run before every call, e.g. parsing a
+                page that func would otherwise modify
+            memory: Also record the peak memory allocated by one extra,
+                untimed call (tracemalloc slows the call down too much to time it)
+
+        Returns:
+            The result of the last call
+        """
+        result = None
+        for _ in range(self.repeat):
+            args = (setup(),) if setup else ()
+            start = time.perf_counter()
+            result = func(*args)
+            self.samples.setdefault(stage, []).append(time.perf_counter() - start)
+        if memory:
+            args = (setup(),) if setup else ()
+            tracemalloc.start()
+            try:
+                func(*args)
+                self.peak_bytes.setdefault(stage, []).append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+        return result
+
+    def results(self) -> Dict[str, Dict]:
+        """Return per-stage statistics in milliseconds"""
+        report = {}
+        for stage, samples in self.samples.items():
+            report[stage] = {
+                'runs': len(samples),
+                'min_ms': round(min(samples) * 1000, 4),
+                'median_ms': round(statistics.median(samples) * 1000, 4),
+                'mean_ms': round(statistics.mean(samples) * 1000, 4),
+                'total_ms': round(sum(samples) * 1000, 4)
+            }
+            if stage in self.peak_bytes:
+                report[stage]['peak_kb'] = round(statistics.median(self.peak_bytes[stage]) / 1024, 1)
+        return report
+
+
+def git_commit() -> str:
+    """Return the current commit hash (with a -dirty suffix), or 'unknown'"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def offline_summarizer(fixtures_dir: str, cache_dir: str, latency: float) -> GmailArticleSummarizer:
+    """Build a summarizer whose HTTP session is answered by FixtureAdapter"""
+    summarizer = GmailArticleSummarizer('bench@example.com', 'unused', 'bench@example.com',
+                                        max_workers=1, host_rate=1000, host_burst=1000,
+                                        cache_dir=cache_dir)
+    adapter = FixtureAdapter(fixtures_dir, latency=latency)
+    summarizer.http.session.mount('http://', adapter)
+    summarizer.http.session.mount('https://', adapter)
+    return summarizer
+
+
+def run_benchmarks(summarizer: GmailArticleSummarizer, timer: StageTimer, fixtures_dir: str):
+    """Time every stage once per fixture and return a short description of the inputs"""
+    feeds = summarizer.rss_feeds
+    cache_path = summarizer.feed_cache.path
+
+    # Feeds: cold (full download and parse) and warm (304 from the feed cache)
+    urls = []
+    for feed in feeds:
+        def cold_fetch(feed=feed):
+            summarizer.feed_cache = FeedCache(cache_path)
+            return summarizer.get_articles_from_rss(feed, max_articles=10)
+        urls.append(timer.time('get_articles_from_rss', cold_fetch))
+        timer.time('get_articles_from_rss (304)',
+                   lambda feed=feed: summarizer.get_articles_from_rss(feed, max_articles=10))
+
+    # Articles: one page per recorded host, through the full scrape path
+    articles = []
+    for feed_urls in urls:
+        if not feed_urls:
+            continue
+        article = timer.time('scrape_article', lambda url=feed_urls[0]: summarizer.scrape_article(url))
+        if article:
+            articles.append(article)
+
+    # Field extraction as scrape_article runs it (site profile or single-pass
+    # extractor), on a fresh parse each run since extraction may prune nodes
+    with open(os.path.join(fixtures_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        page_urls = {}
+        for url, page in json.load(f).get('articles', {}).items():
+            page_urls.setdefault(page, url)
+    pages = sorted(page_urls)
+    for page in pages:
+        with open(os.path.join(fixtures_dir, page), 'rb') as f:
+            html = f.read()
+        parse = lambda html=html: BeautifulSoup(html, HTML_PARSER)
+        timer.time('_extract_fields', lambda soup, url=page_urls[page]: summarizer._extract_fields(soup, url),
+                   setup=parse)
+        # Cleanup of the extracted text: time and peak allocation per article
+        raw = summarizer._extract_fields(parse(), page_urls[page])['content']
+        if raw:
+            timer.time('_clean_content', lambda raw=raw, page=page: summarizer._clean_content(raw, page_urls[page]),
+                       memory=True)
+
+    # Text analysis and summary on the scraped article text
+    for article in articles:
+        content = article['content']
+        timer.time('AnalyzedDocument', lambda: AnalyzedDocument(content))
+        # Fresh document per run so lazily built counts are part of the measurement
+        for method in ('_extract_key_insights', '_extract_topics', '_extract_takeaways',
+                       '_calculate_relevance_score'):
+            timer.time(method, getattr(summarizer, method), setup=lambda: AnalyzedDocument(content))
+        timer.time('_rule_based_summary', lambda _, article=article: summarizer._rule_based_summary(article),
+                   setup=lambda: summarizer.extractive and summarizer.extractive._memo.clear())
+
+    # The extractive summarizer ranks a whole run's sentences in one batched computation
+    if summarizer.extractive and articles:
+        contents = [article['content'] for article in articles]
+        timer.time('extractive summarize_many (run)', lambda _: summarizer.extractive.summarize_many(contents),
+                   setup=summarizer.extractive._memo.clear)
+
+    # Near-duplicate check: fingerprint each article, then look it up among 20k sent ones
+    if articles:
+        index = NearDuplicateIndex()
+        rng = random.Random(0)
+        index.add_many((f'https://example.com/{i}', rng.getrandbits(64)) for i in range(20000))
+        for article in articles:
+            fingerprint = timer.time('simhash', lambda content=article['content']: simhash(content))
+            if fingerprint is not None:
+                timer.time('NearDuplicateIndex.find (20k)', lambda: index.find(fingerprint))
+
+    # Email rendering (send_email without the SMTP round trip)
+    summaries = [summarizer._summary_result(article, summarizer._rule_based_summary(article), 'rule_based')
+                 for article in articles]
+    if summaries:
+        timer.time('send_email (render)', lambda: summarizer._render_email_html(summaries))
+        # Digest size scaling: render time should grow linearly with the article count
+        for count in (10, 100, 1000):
+            digest = [summaries[i % len(summaries)] for i in range(count)]
+            timer.time(f'render_digest ({count} articles)', lambda digest=digest: render_digest(digest),
+                       memory=True)
+
+    return {'feeds': len(feeds), 'article_urls': sum(len(u) for u in urls),
+            'articles_scraped': len(articles), 'pages': len(pages)}, articles
+
+
+def run_hf_benchmarks(summarizer: GmailArticleSummarizer, timer: StageTimer, articles: List[Dict],
+                      request_latency: float):
+    """Time summarize_articles against the stand-in endpoint, batched and one request per article"""
+    server = start_stub_server(request_latency=request_latency)
+    # The fixture adapter answers everything else; the stub needs a real connection
+    summarizer.http.session.mount('http://127.0.0.1', HTTPAdapter())
+    hf = summarizer.huggingface
+    hf.api_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    hf.token = 'bench'
+    batch_size = hf.batch_size
+    # Only Hugging Face meets quality 3, so it is routed first in both stages
+    quality_floor = summarizer.backends.quality_floor
+    summarizer.backends.quality_floor = 3
+
+    def fresh_cache():
+        summarizer.summary_cache = SummaryCache(None)
+
+    try:
+        for size in (1, batch_size):
+            hf.batch_size = size
+            label = 'batched' if size > 1 else 'unbatched'
+            requests_before = server.request_count
+            timer.time(f"summarize_articles (hf {label})",
+                       lambda _: summarizer.summarize_articles(articles), setup=fresh_cache)
+            if server.request_count == requests_before:
+                raise RuntimeError(f"summarize_articles (hf {label}) sent no request to the stub; "
+                                   f"the timing would be of another backend")
+    finally:
+        hf.batch_size = batch_size
+        summarizer.backends.quality_floor = quality_floor
+        server.shutdown()
+
+
+def print_report(results: Dict[str, Dict], baseline: Dict[str, Dict] = None):
+    """Print a per-stage table, with the change against a baseline when given"""
+    header = f"{'stage':<36}{'runs':>6}{'median ms':>12}{'min ms':>10}{'peak KB':>9}"
+    print(header + (f"{'base ms':>10}{'change':>9}" if baseline else ''))
+    for stage, stats in results.items():
+        peak = f"{stats['peak_kb']:>9.1f}" if 'peak_kb' in stats else f"{'-':>9}"
+        line = f"{stage:<36}{stats['runs']:>6}{stats['median_ms']:>12.3f}{stats['min_ms']:>10.3f}{peak}"
+        if baseline:
+            base = baseline.get(stage)
+            if base and base['median_ms']:
+                change = (stats['median_ms'] - base['median_ms']) / base['median_ms'] * 100
+                line += f"{base['median_ms']:>10.3f}{change:>+8.1f}%"
+            else:
+                line += f"{'-':>10}{'new':>9}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Directory with manifest.json and recordings')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per stage and input')
+    parser.add_argument('--latency', type=float, default=0.0, help='Simulated seconds of network wait per request')
+    parser.add_argument('--output', help='Write JSON results here (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='Earlier JSON results file to compare against')
+    parser.add_argument('--hf-stub', action='store_true', help='Also time Hugging Face batching against a local stub')
+    parser.add_argument('--hf-latency', type=float, default=0.05, help='Stub seconds per Hugging Face request')
+    args = parser.parse_args()
+
+    # Per-article INFO logging would dominate the timings of the fast stages
+    logging.getLogger().setLevel(logging.WARNING)
+    cache_dir = tempfile.mkdtemp(prefix='bench_cache_')
+    summarizer = offline_summarizer(args.fixtures, cache_dir, args.latency)
+    timer = StageTimer(args.repeat)
+    try:
+        inputs, articles = run_benchmarks(summarizer, timer, args.fixtures)
+        if args.hf_stub:
+            run_hf_benchmarks(summarizer, timer, articles, args.hf_latency)
+    finally:
+        summarizer.close()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'html_parser': HTML_PARSER,
+        'repeat': timer.repeat,
+        'latency': args.latency,
+        'inputs': inputs,
+        'stages': timer.results()
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline_report = json.load(f)
+        baseline = baseline_report.get('stages', {})
+        print(f"Comparing {commit} against {baseline_report.get('commit', args.compare)}")
+    print_report(report['stages'], baseline)
+
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results', f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
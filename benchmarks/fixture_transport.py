@@ -0,0 +1,94 @@
+"""
+Offline transport for benchmarks
+A requests transport adapter that answers from recorded fixtures instead of
+the network, so the real feed and article URLs (and with them host-based
+rate limiting and extraction profiles) work unchanged.
+
+fixtures/manifest.json maps exact feed URLs to recorded RSS files and article
+hostnames to a recorded page that is served for every path on that host.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from requests.adapters import BaseAdapter
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def _host(url: str) -> str:
+    host = url.split('://', 1)[-1].split('/', 1)[0].split(':', 1)[0].lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class FixtureAdapter(BaseAdapter):
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, latency: float = 0.0):
+        """
+        Initialize the adapter
+
+        Args:
+            fixtures_dir: Directory containing manifest.json and the recorded files
+            latency: Seconds to sleep per request, to model network wait
+        """
+        super().__init__()
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        with open(os.path.join(fixtures_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.feeds: Dict[str, str] = manifest.get('feeds', {})
+        self.articles: Dict[str, str] = manifest.get('articles', {})
+        self._bodies: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.request_count = 0
+
+    def _resolve(self, url: str) -> Optional[str]:
+        if url in self.feeds:
+            return self.feeds[url]
+        return self.articles.get(_host(url))
+
+    def _body(self, relative_path: str) -> bytes:
+        with self._lock:
+            if relative_path not in self._bodies:
+                with open(os.path.join(self.fixtures_dir, relative_path), 'rb') as f:
+                    self._bodies[relative_path] = f.read()
+            return self._bodies[relative_path]
+
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None) -> Response:
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.encoding = 'utf-8'
+        headers = CaseInsensitiveDict()
+
+        relative_path = self._resolve(request.url)
+        if relative_path is None:
+            response.status_code, response.reason, body = 404, 'Not Found', b''
+        else:
+            body = self._body(relative_path)
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            headers['ETag'] = etag
+            headers['Content-Type'] = 'application/rss+xml' if relative_path.endswith('.xml') else 'text/html'
+            if request.headers.get('If-None-Match') == etag:
+                response.status_code, response.reason, body = 304, 'Not Modified', b''
+            else:
+                response.status_code, response.reason = 200, 'OK'
+
+        headers['Content-Length'] = str(len(body))
+        response.headers = headers
+        response.raw = io.BytesIO(body)
+        return response
+
+    def close(self):
+        pass
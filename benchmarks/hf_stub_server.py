@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Hugging Face summarization endpoint
+Answers POSTs shaped like the Inference API ({"inputs": str or [str]}) with the
+first sentence of each input, after a fixed per-request plus per-input delay,
+so batched and unbatched summarization can be compared without a token.
+
+Inputs containing FAIL_MARKER make the whole request return 500, which
+exercises the per-item fallback. --status answers every request with the
+given status instead (e.g. 503 with Retry-After to exercise the breaker).
+
+Usage: python benchmarks/hf_stub_server.py [--port N] [--request-latency S] [--item-latency S] [--status N]
+Then set HUGGINGFACE_API_URL=http://127.0.0.1:<port>/ and any HUGGINGFACE_TOKEN.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FAIL_MARKER = '[hf-stub-fail]'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with server.lock:
+            server.request_count += 1
+        try:
+            inputs = json.loads(body)['inputs']
+        except (ValueError, KeyError, TypeError):
+            return self._reply(400, {'error': 'expected {"inputs": ...}'})
+
+        batch = inputs if isinstance(inputs, list) else [inputs]
+        time.sleep(server.request_latency + server.item_latency * len(batch))
+        if server.status:
+            return self._reply(server.status, {'error': 'stub status', 'estimated_time': 20.0},
+                               {'Retry-After': '30'} if server.status in (429, 503) else None)
+        if any(FAIL_MARKER in text for text in batch):
+            return self._reply(500, {'error': 'stub failure'})
+
+        results = [{'summary_text': text.split('. ')[0].strip()} for text in batch]
+        self._reply(200, results)
+
+    def _reply(self, status: int, payload, headers: dict = None):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port: int = 0, request_latency: float = 0.0,
+                      item_latency: float = 0.0, status: int = 0) -> ThreadingHTTPServer:
+    """
+    Start the stand-in server on a background thread
+
+    Args:
+        port: Port to listen on (0 picks a free one; see server.server_address)
+        request_latency: Seconds added to every request, modelling round trip and queueing
+        item_latency: Seconds added per input, modelling model compute
+        status: Answer every request with this HTTP status (0 = normal behaviour)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.request_latency = request_latency
+    server.item_latency = item_latency
+    server.status = status
+    server.request_count = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--request-latency', type=float, default=0.3, help='Seconds per request')
+    parser.add_argument('--item-latency', type=float, default=0.05, help='Seconds per input')
+    parser.add_argument('--status', type=int, default=0, help='Answer every request with this status')
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.request_latency, args.item_latency, args.status)
+    print(f"Stub Hugging Face endpoint on http://127.0.0.1:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Frozen copy of the original selector-cascade extractor
+scrape_article now uses ContentExtractor (one pass over the page) or a site
+profile. This copy of the four-method cascade it replaced is kept only as a
+baseline for bench_extraction.py; it is not used by the summarizer and should
+not be changed.
+"""
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup
+
+
+def extract_title(soup: BeautifulSoup) -> Optional[str]:
+    """Extract article title"""
+    selectors = ['h1', 'h2', '.title', '.post-title', '.entry-title', '.article-title']
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element and element.get_text().strip():
+            return element.get_text().strip()
+    return None
+
+
+def extract_content(soup: BeautifulSoup) -> Optional[str]:
+    """Extract main article content"""
+    selectors = [
+        '.entry-content',  # TechCrunch, WordPress sites
+        'main',            # General main content
+        'article',         # Standard article tag
+        '.content',        # Generic content
+        '.post-body',      # Blog posts
+        '.article-body',   # Article content
+        '.post-content',   # Post content
+        '.story-body',     # Story content
+        '.wp-block-post-content',  # WordPress blocks
+        '.article-content' # Article content
+    ]
+
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element:
+            # Remove unwanted elements
+            for unwanted in element.select('script, style, nav, header, footer, .ads, .advertisement, .wp-block-buttons, .wp-block-columns'):
+                unwanted.decompose()
+
+            text = element.get_text().strip()
+            if len(text) > 100:  # Ensure we got substantial content
+                return text
+
+    # Fallback: look for any div with substantial text
+    div = find_text_block(soup, min_length=1000)
+    if div:
+        # Remove unwanted elements
+        for unwanted in div.select('script, style, nav, header, footer'):
+            unwanted.decompose()
+        return div.get_text().strip()
+
+    return None
+
+
+def find_text_block(soup: BeautifulSoup, min_length: int) -> Optional[BeautifulSoup]:
+    """
+    Find the first div whose visible text is longer than min_length
+
+    Text lengths are summed bottom-up in a single pass over the tree instead
+    of calling get_text() on every div, which is quadratic on nested layouts.
+    """
+    skipped = {'script', 'style', 'nav', 'header', 'footer'}
+    tags = soup.find_all(True)
+    lengths = {}
+    for text in soup.find_all(string=True):
+        parent = text.parent
+        if parent is not None and parent.name not in skipped:
+            lengths[id(parent)] = lengths.get(id(parent), 0) + len(text.strip())
+
+    # Children come after their parents in document order, so walking
+    # backwards finishes every subtree before its parent is visited
+    for tag in reversed(tags):
+        if tag.name in skipped:
+            lengths.pop(id(tag), None)
+            continue
+        if tag.parent is not None:
+            lengths[id(tag.parent)] = lengths.get(id(tag.parent), 0) + lengths.get(id(tag), 0)
+
+    for tag in tags:
+        if tag.name == 'div' and lengths.get(id(tag), 0) > min_length:
+            return tag
+    return None
+
+
+def extract_author(soup: BeautifulSoup) -> Optional[str]:
+    """Extract article author"""
+    selectors = ['.author', '.byline', '.post-author', '.entry-author', '.writer']
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element and element.get_text().strip():
+            return element.get_text().strip()
+    return None
+
+
+def extract_date(soup: BeautifulSoup) -> Optional[str]:
+    """Extract article date"""
+    selectors = ['.date', '.published-date', '.post-date', '.entry-date', 'time']
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element and element.get_text().strip():
+            return element.get_text().strip()
+    return None
+
+
+def legacy_extract(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+    """The original four-method selector cascade"""
+    return {
+        'title': extract_title(soup),
+        'content': extract_content(soup),
+        'author': extract_author(soup),
+        'date': extract_date(soup)
+    }
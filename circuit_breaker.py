@@ -0,0 +1,184 @@
+"""
+Circuit breakers for external summarizer endpoints
+A breaker opens after consecutive failures, or at once on a rate-limit or
+overload status (429/503), so the remaining articles of a run stop waiting on
+an endpoint that is known to be down. After the open period a single trial
+call is let through (half-open); success closes the breaker, failure opens it
+again for twice as long. State can be saved so the next run starts from it.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class BackendUnavailable(Exception):
+    """Raised by a backend client when the endpoint says it cannot serve requests now"""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(f"HTTP {status_code}" + (f", retry after {retry_after:.0f}s" if retry_after else ""))
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 300,
+                 max_reset_timeout: float = 3600, trip_status_codes: Iterable[int] = (429, 503)):
+        """
+        Initialize a breaker
+
+        Args:
+            name: Backend name used in log messages
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a trial call
+            max_reset_timeout: Upper bound for the open period after repeated trips
+            trip_status_codes: HTTP statuses that open the breaker immediately
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.trip_status_codes = set(trip_status_codes)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._open_until = 0.0
+        self._open_for = reset_timeout
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.time() >= self._open_until:
+                return HALF_OPEN
+            return self._state
+
+    def available(self) -> bool:
+        """Return whether a call could be let through now (does not reserve it)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.time() < self._open_until:
+                return False
+            return not self._trial_in_flight
+
+    def acquire(self) -> bool:
+        """
+        Reserve permission for one call
+
+        Returns:
+            True when closed, or for the single trial call once the open period
+            has ended; False otherwise
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.time() < self._open_until:
+                    return False
+                self._transition(HALF_OPEN, "open period ended, sending a trial call")
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self._state != CLOSED:
+                self._open_for = self.reset_timeout
+                self._transition(CLOSED, "trial call succeeded")
+
+    def record_failure(self, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Record a failed call
+
+        Args:
+            status_code: HTTP status of the failure, if there was one
+            retry_after: Seconds the endpoint asked us to wait, if it said
+        """
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN:
+                self._open_for = min(self._open_for * 2, self.max_reset_timeout)
+                self._open(retry_after, "trial call failed")
+            elif self._state == CLOSED:
+                if status_code in self.trip_status_codes:
+                    self._open(retry_after, f"HTTP {status_code}")
+                elif self._failures >= self.failure_threshold:
+                    self._open(retry_after, f"{self._failures} consecutive failures")
+
+    def trip(self, reason: str, duration: Optional[float] = None):
+        """Open the breaker now, e.g. when the caller sees a high error rate"""
+        with self._lock:
+            if self._state != OPEN:
+                self._trial_in_flight = False
+                self._open(duration, reason)
+
+    def _open(self, duration: Optional[float], reason: str):
+        duration = min(duration, self.max_reset_timeout) if duration else self._open_for
+        self._open_until = time.time() + duration
+        self._transition(OPEN, f"{reason}, retrying in {duration:.0f}s")
+
+    def _transition(self, state: str, reason: str):
+        if state != self._state:
+            log = logger.info if state != OPEN else logger.warning
+            log(f"Circuit breaker '{self.name}': {self._state} -> {state} ({reason})")
+        self._state = state
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {'state': self._state, 'failures': self._failures,
+                    'open_until': self._open_until, 'open_for': self._open_for}
+
+    def restore(self, data: Dict):
+        """Restore state saved by to_dict() (a trial in flight is not carried over)"""
+        with self._lock:
+            state = data.get('state', CLOSED)
+            self._state = OPEN if state == HALF_OPEN else state
+            self._failures = int(data.get('failures', 0))
+            self._open_until = float(data.get('open_until', 0.0))
+            self._open_for = float(data.get('open_for', self.reset_timeout))
+            if self._state != CLOSED:
+                logger.info(f"Circuit breaker '{self.name}' restored as {self._state}")
+
+
+def load_breakers(path: str, breakers: Iterable[CircuitBreaker]):
+    """Restore saved state into the given breakers, matched by name"""
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable breaker state {path}: {str(e)}")
+        return
+    for breaker in breakers:
+        if breaker.name in saved:
+            breaker.restore(saved[breaker.name])
+
+
+def save_breakers(path: str, breakers: Iterable[CircuitBreaker]):
+    """Write the state of the given breakers to path (atomically)"""
+    if not path:
+        return
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({breaker.name: breaker.to_dict() for breaker in breakers}, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not save breaker state {path}: {str(e)}")
@@ -0,0 +1,56 @@
+"""
+Article text cleanup
+Collapses whitespace and removes boilerplate phrases ("Advertisement",
+"Subscribe to our newsletter", ...) with one precompiled regular expression,
+instead of one str.replace per phrase. Phrases only match whole words,
+case-insensitively; a removed phrase and the spaces around it collapse into a
+single space.
+
+The regex only runs on text that contains a phrase at all (a substring test
+on the lowercased text), so the usual article costs a split/join and a
+lower(): CPython's regex engine steps through every character position and
+is over ten times slower than those on clean text.
+"""
+import re
+from typing import Iterable, List
+
+DEFAULT_BOILERPLATE = [
+    'advertisement', 'sponsored', 'subscribe', 'newsletter',
+    'privacy policy', 'terms of service', 'cookie policy'
+]
+
+
+def _phrase_pattern(phrase: str) -> str:
+    """Regex for one phrase: any whitespace between words, word boundaries at word-character edges"""
+    body = r'\s+'.join(re.escape(word) for word in phrase.split())
+    start = r'\b' if re.match(r'\w', phrase) else ''
+    end = r'\b' if re.search(r'\w$', phrase) else ''
+    return start + body + end
+
+
+class ContentCleaner:
+    def __init__(self, phrases: Iterable[str] = DEFAULT_BOILERPLATE):
+        """
+        Compile the cleaner
+
+        Args:
+            phrases: Boilerplate words or phrases to remove (case-insensitive)
+        """
+        self.phrases: List[str] = list(dict.fromkeys(p.strip().lower() for p in phrases if p.strip()))
+        # Longest first, so "cookie policy" wins over a shorter phrase it starts with
+        alternatives = '|'.join(_phrase_pattern(phrase)
+                                for phrase in sorted(self.phrases, key=len, reverse=True))
+        self._pattern = re.compile(rf'(?:\s*(?:{alternatives}))+\s*', re.IGNORECASE) if alternatives else None
+
+    def clean(self, text: str) -> str:
+        """Return text with whitespace collapsed to single spaces and boilerplate removed"""
+        text = ' '.join(text.split())
+        # Whitespace is now single spaces, so a plain substring test finds every candidate
+        lowered = text.lower()
+        if self._pattern and any(phrase in lowered for phrase in self.phrases):
+            text = self._pattern.sub(' ', text).strip()
+        return text
+
+    def extend(self, phrases: Iterable[str]) -> 'ContentCleaner':
+        """Return a new cleaner removing these phrases as well"""
+        return ContentCleaner(self.phrases + list(phrases))
@@ -0,0 +1,193 @@
+"""
+Single-pass article extraction
+Walks the parsed page once, collecting title, body, author and date candidates
+together with per-element text statistics, instead of running a separate
+select_one() cascade over the whole document for every field.
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+logger = logging.getLogger(__name__)
+
+# Same selectors, in the same priority order, as the original extraction methods
+DEFAULT_SELECTORS = {
+    'title': ['h1', 'h2', '.title', '.post-title', '.entry-title', '.article-title'],
+    'content': [
+        '.entry-content', 'main', 'article', '.content', '.post-body', '.article-body',
+        '.post-content', '.story-body', '.wp-block-post-content', '.article-content'
+    ],
+    'author': ['.author', '.byline', '.post-author', '.entry-author', '.writer'],
+    'date': ['.date', '.published-date', '.post-date', '.entry-date', 'time']
+}
+
+# Elements whose text never counts towards the article body
+SKIPPED_TAGS = {'script', 'style', 'noscript', 'template'}
+BOILERPLATE_TAGS = {'nav', 'header', 'footer'}
+BOILERPLATE_CLASSES = {'ads', 'advertisement', 'wp-block-buttons', 'wp-block-columns'}
+
+# Elements that hold body paragraphs for the text-density fallback
+PARAGRAPH_TAGS = {'p', 'pre', 'blockquote', 'td'}
+BLOCK_TAGS = {'div', 'section', 'article', 'main', 'td'}
+
+MIN_CONTENT_LENGTH = 100
+MIN_FALLBACK_LENGTH = 500
+
+
+def _parse_selector(selector: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split a 'tag', '.class' or 'tag.class' selector into (tag, class)"""
+    tag, _, css_class = selector.partition('.')
+    return (tag or None), (css_class or None)
+
+
+class ContentExtractor:
+    def __init__(self, selectors: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the extractor
+
+        Args:
+            selectors: Per-field selector lists in priority order; only 'tag',
+                '.class' and 'tag.class' forms are supported
+        """
+        self.selectors = selectors or DEFAULT_SELECTORS
+        # (field, priority) lookups keyed by tag name and by class name
+        self._by_tag: Dict[str, List[Tuple[str, int, Optional[str]]]] = {}
+        self._by_class: Dict[str, List[Tuple[str, int, Optional[str]]]] = {}
+        for field, field_selectors in self.selectors.items():
+            for priority, selector in enumerate(field_selectors):
+                tag, css_class = _parse_selector(selector)
+                if css_class:
+                    self._by_class.setdefault(css_class, []).append((field, priority, tag))
+                elif tag:
+                    self._by_tag.setdefault(tag, []).append((field, priority, None))
+
+    def _matches(self, tag: Tag) -> List[Tuple[str, int]]:
+        matches = [(field, priority) for field, priority, _ in self._by_tag.get(tag.name, ())]
+        for css_class in tag.get('class') or ():
+            for field, priority, tag_name in self._by_class.get(css_class, ()):
+                if tag_name is None or tag_name == tag.name:
+                    matches.append((field, priority))
+        return matches
+
+    @staticmethod
+    def _is_boilerplate(tag: Tag) -> bool:
+        if tag.name in BOILERPLATE_TAGS:
+            return True
+        return any(css_class in BOILERPLATE_CLASSES for css_class in tag.get('class') or ())
+
+    def extract(self, soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+        """
+        Extract title, content, author and date from a parsed page
+
+        Args:
+            soup: Parsed HTML document
+
+        Returns:
+            Dictionary with 'title', 'content', 'author' and 'date' (None when missing)
+        """
+        # Single walk over the document: remember tags in document order and
+        # attribute every visible string to its parent element
+        tags: List[Tag] = []
+        own_len: Dict[int, int] = {}
+        own_commas: Dict[int, int] = {}
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                tags.append(node)
+            elif type(node) in (NavigableString, CData):
+                parent = node.parent
+                if parent is None or parent.name in SKIPPED_TAGS:
+                    continue
+                length = len(node.strip())
+                if length:
+                    own_len[id(parent)] = own_len.get(id(parent), 0) + length
+                    own_commas[id(parent)] = own_commas.get(id(parent), 0) + node.count(',')
+
+        # Walk the tag list backwards: every subtree is complete before its
+        # parent is visited, so each entry holds the children's sums on arrival
+        # and is replaced by the element's own total before being pushed upwards
+        text_len: Dict[int, int] = {}
+        body_len: Dict[int, int] = {}
+        link_len: Dict[int, int] = {}
+        commas: Dict[int, int] = {}
+        scores: Dict[int, float] = {}
+        candidates: Dict[str, Dict[int, Tag]] = {field: {} for field in DEFAULT_SELECTORS}
+        for tag in reversed(tags):
+            key = id(tag)
+            if tag.name in SKIPPED_TAGS:
+                total = body = links = comma_count = 0
+            else:
+                total = own_len.get(key, 0) + text_len.get(key, 0)
+                body = 0 if self._is_boilerplate(tag) else own_len.get(key, 0) + body_len.get(key, 0)
+                links = total if tag.name == 'a' else link_len.get(key, 0)
+                comma_count = own_commas.get(key, 0) + commas.get(key, 0)
+            text_len[key], body_len[key], link_len[key], commas[key] = total, body, links, comma_count
+
+            # Later (reverse-order) visits overwrite, leaving the first match in document order
+            for field, priority in self._matches(tag):
+                candidates.setdefault(field, {})[priority] = tag
+
+            parent = tag.parent
+            if parent is None:
+                continue
+            parent_key = id(parent)
+            text_len[parent_key] = text_len.get(parent_key, 0) + total
+            body_len[parent_key] = body_len.get(parent_key, 0) + body
+            link_len[parent_key] = link_len.get(parent_key, 0) + links
+            commas[parent_key] = commas.get(parent_key, 0) + comma_count
+
+            # Paragraph scores go to the parent and (halved) the grandparent
+            if tag.name in PARAGRAPH_TAGS and body >= 25:
+                score = 1 + comma_count + min(body / 100, 3)
+                scores[parent_key] = scores.get(parent_key, 0) + score
+                if parent.parent is not None:
+                    grandparent_key = id(parent.parent)
+                    scores[grandparent_key] = scores.get(grandparent_key, 0) + score / 2
+
+        return {
+            'title': self._first_text(candidates['title'], text_len),
+            'content': self._content(candidates['content'], tags, body_len, link_len, scores),
+            'author': self._first_text(candidates['author'], text_len),
+            'date': self._first_text(candidates['date'], text_len)
+        }
+
+    @staticmethod
+    def _first_text(found: Dict[int, Tag], text_len: Dict[int, int]) -> Optional[str]:
+        for priority in sorted(found):
+            element = found[priority]
+            if text_len.get(id(element)):
+                text = element.get_text().strip()
+                if text:
+                    return text
+        return None
+
+    def _content(self, found: Dict[int, Tag], tags: List[Tag], body_len: Dict[int, int],
+                 link_len: Dict[int, int], scores: Dict[int, float]) -> Optional[str]:
+        for priority in sorted(found):
+            element = found[priority]
+            if body_len.get(id(element), 0) > MIN_CONTENT_LENGTH:
+                return self._body_text(element)
+
+        # Fallback: the block with the best paragraph score, discounted by link density
+        best, best_score = None, 0.0
+        for tag in tags:
+            key = id(tag)
+            if tag.name not in BLOCK_TAGS or key not in scores:
+                continue
+            length = body_len.get(key, 0)
+            if length < MIN_FALLBACK_LENGTH:
+                continue
+            density = 1 - min(link_len.get(key, 0) / length, 1)
+            score = scores[key] * density
+            if score > best_score:
+                best, best_score = tag, score
+        return self._body_text(best) if best is not None else None
+
+    def _body_text(self, element: Tag) -> str:
+        for unwanted in element.find_all(True):
+            # Descendants of an already removed element are skipped
+            if unwanted.decomposed:
+                continue
+            if unwanted.name in SKIPPED_TAGS or self._is_boilerplate(unwanted):
+                unwanted.decompose()
+        return element.get_text().strip()
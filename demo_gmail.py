@@ -2,7 +2,7 @@
 """
 Demo script showing Gmail Article Summarizer functionality
 """
-from datetime import datetime
+from email_renderer import render_digest
 
 def create_sample_summaries():
     """Create sample article summaries for demo"""
@@ -56,80 +56,10 @@ def create_sample_summaries():
 
 def generate_email_html(summaries):
     """Generate HTML email content"""
-    html_content = f"""
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; }}
-            .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; text-align: center; }}
-            .article {{ border: 1px solid #ddd; border-radius: 8px; padding: 20px; margin-bottom: 20px; background-color: #fff; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-            .title {{ color: #2c3e50; font-size: 18px; font-weight: bold; margin-bottom: 10px; }}
-            .meta {{ color: #7f8c8d; font-size: 14px; margin-bottom: 15px; }}
-            .summary {{ background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin-bottom: 15px; border-left: 4px solid #3498db; }}
-            .insights {{ margin-bottom: 15px; }}
-            .topics {{ color: #3498db; font-weight: bold; }}
-            .score {{ color: #e74c3c; font-weight: bold; }}
-            .url {{ color: #3498db; text-decoration: none; }}
-            .url:hover {{ text-decoration: underline; }}
-            .footer {{ text-align: center; margin-top: 30px; color: #7f8c8d; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>📰 Daily Article Summaries</h1>
-            <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Found {len(summaries)} relevant articles from tech RSS feeds</p>
-        </div>
-    """
-    
-    for i, summary in enumerate(summaries, 1):
-        article_data = summary['article_data']
-        summary_data = summary['summary_data']
-        
-        html_content += f"""
-        <div class="article">
-            <div class="title">{i}. {article_data['title']}</div>
-            <div class="meta">
-                <strong>Author:</strong> {article_data.get('author', 'Unknown')} | 
-                <strong>Date:</strong> {article_data.get('date', 'Unknown')} | 
-                <strong>Relevance Score:</strong> <span class="score">{summary_data['relevance_score']}/10</span>
-            </div>
-            
-            <div class="summary">
-                <strong>Summary:</strong><br>
-                {summary_data['summary']}
-            </div>
-            
-            <div class="insights">
-                <strong>Key Insights:</strong><br>
-                {summary_data['key_insights']}
-            </div>
-            
-            <div class="insights">
-                <strong>Main Topics:</strong> <span class="topics">{summary_data['topics']}</span>
-            </div>
-            
-            <div class="insights">
-                <strong>Actionable Takeaways:</strong><br>
-                {summary_data['takeaways']}
-            </div>
-            
-            <div class="meta">
-                <a href="{article_data['url']}" class="url" target="_blank">📖 Read Full Article</a>
-            </div>
-        </div>
-        """
-    
-    html_content += """
-        <div class="footer">
-            <p>🤖 Powered by FREE AI Summarization</p>
-            <p>📧 Sent via Gmail Article Summarizer</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    return html_content
+    return render_digest(summaries, footer=[
+        "🤖 Powered by FREE AI Summarization",
+        "📧 Sent via Gmail Article Summarizer"
+    ])
 
 def save_demo_email():
     """Save demo email as HTML file"""
@@ -0,0 +1,180 @@
+"""
+HTML rendering of the summary email
+The page and article templates are parsed once into literal and field parts;
+rendering writes those parts and the escaped field values to a writer (a
+list's append, or an io.StringIO's write), so a digest is built in time
+linear in the number of articles instead of by repeated string concatenation.
+Used by send_email and by the demo.
+"""
+import html
+from datetime import datetime
+from string import Formatter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+STYLESHEET = """
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; }
+            .header { background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; text-align: center; }
+            .article { border: 1px solid #ddd; border-radius: 8px; padding: 20px; margin-bottom: 20px; background-color: #fff; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            .title { color: #2c3e50; font-size: 18px; font-weight: bold; margin-bottom: 10px; }
+            .meta { color: #7f8c8d; font-size: 14px; margin-bottom: 15px; }
+            .summary { background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin-bottom: 15px; border-left: 4px solid #3498db; }
+            .insights { margin-bottom: 15px; }
+            .topics { color: #3498db; font-weight: bold; }
+            .score { color: #e74c3c; font-weight: bold; }
+            .url { color: #3498db; text-decoration: none; }
+            .url:hover { text-decoration: underline; }
+            .footer { text-align: center; margin-top: 30px; color: #7f8c8d; font-size: 12px; }
+"""
+
+HEADER_TEMPLATE = """
+    <html>
+    <head>
+        <style>{stylesheet}        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>📰 Daily Article Summaries</h1>
+            <p>Generated on {generated_at}</p>
+            <p>Found {count} relevant articles from tech RSS feeds</p>
+        </div>
+"""
+
+ARTICLE_TEMPLATE = """
+        <div class="article">
+            <div class="title">{index}. {title}</div>
+            <div class="meta">
+                <strong>Author:</strong> {author} |
+                <strong>Date:</strong> {date} |
+                <strong>Relevance Score:</strong> <span class="score">{relevance_score}/10</span>
+            </div>
+
+            <div class="summary">
+                <strong>Summary:</strong><br>
+                {summary}
+            </div>
+
+            <div class="insights">
+                <strong>Key Insights:</strong><br>
+                {key_insights}
+            </div>
+
+            <div class="insights">
+                <strong>Main Topics:</strong> <span class="topics">{topics}</span>
+            </div>
+
+            <div class="insights">
+                <strong>Actionable Takeaways:</strong><br>
+                {takeaways}
+            </div>
+
+            <div class="meta">
+                <a href="{url}" class="url" target="_blank">📖 Read Full Article</a>
+            </div>
+        </div>
+"""
+
+FOOTER_TEMPLATE = """
+        <div class="footer">{lines}
+        </div>
+"""
+
+CLOSING = """
+    </body>
+    </html>
+"""
+
+
+class CompiledTemplate:
+    def __init__(self, source: str):
+        """
+        Parse a str.format-style template once
+
+        Args:
+            source: Template with {name} fields (no format specs or conversions)
+        """
+        self.parts: List[Tuple[str, Optional[str]]] = [
+            (literal, field) for literal, field, _, _ in Formatter().parse(source)
+        ]
+
+    def render_into(self, write: Callable[[str], object], values: Dict[str, str]):
+        """Write the template with values (already escaped) substituted"""
+        for literal, field in self.parts:
+            if literal:
+                write(literal)
+            if field is not None:
+                write(values[field])
+
+
+_HEADER = CompiledTemplate(HEADER_TEMPLATE)
+_ARTICLE = CompiledTemplate(ARTICLE_TEMPLATE)
+_FOOTER = CompiledTemplate(FOOTER_TEMPLATE)
+
+
+def _text(value, default: str = 'Unknown') -> str:
+    return html.escape(str(value)) if value not in (None, '') else default
+
+
+def _href(url: Optional[str]) -> str:
+    # Only web links; anything else (javascript:, data:) becomes a dead link
+    if not url or not url.lower().startswith(('http://', 'https://')):
+        return '#'
+    return html.escape(url, quote=True)
+
+
+def render_digest_into(write: Callable[[str], object], summaries: Iterable[Dict], count: int,
+                       generated_at: Optional[datetime] = None, footer: Iterable[str] = ()):
+    """
+    Write the summary email to a writer
+
+    Args:
+        write: Called with each piece of the document in order
+        summaries: Summary dictionaries with 'article_data' and 'summary_data'
+        count: Number of summaries (shown in the header)
+        generated_at: Time shown in the header (default: now)
+        footer: Lines of plain text for a footer (none by default)
+    """
+    generated_at = generated_at or datetime.now()
+    _HEADER.render_into(write, {
+        'stylesheet': STYLESHEET,
+        'generated_at': generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'count': str(count)
+    })
+    for index, summary in enumerate(summaries, 1):
+        article_data = summary['article_data']
+        summary_data = summary['summary_data']
+        _ARTICLE.render_into(write, {
+            'index': str(index),
+            'title': _text(article_data.get('title'), ''),
+            'author': _text(article_data.get('author')),
+            'date': _text(article_data.get('date')),
+            'relevance_score': _text(summary_data.get('relevance_score'), '0'),
+            'summary': _text(summary_data.get('summary'), ''),
+            'key_insights': _text(summary_data.get('key_insights'), ''),
+            'topics': _text(summary_data.get('topics'), ''),
+            'takeaways': _text(summary_data.get('takeaways'), ''),
+            'url': _href(article_data.get('url'))
+        })
+    footer = list(footer)
+    if footer:
+        _FOOTER.render_into(write, {
+            'lines': ''.join(f"\n            <p>{html.escape(line)}</p>" for line in footer)
+        })
+    write(CLOSING)
+
+
+def render_digest(summaries: List[Dict], generated_at: Optional[datetime] = None,
+                  footer: Iterable[str] = ()) -> str:
+    """
+    Render the summary email
+
+    Args:
+        summaries: Summary dictionaries with 'article_data' and 'summary_data'
+        generated_at: Time shown in the header (default: now)
+        footer: Lines of plain text for a footer (none by default)
+
+    Returns:
+        HTML document as a string
+    """
+    parts: List[str] = []
+    render_digest_into(parts.append, summaries, len(summaries), generated_at, footer)
+    return ''.join(parts)
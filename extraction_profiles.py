@@ -0,0 +1,131 @@
+"""
+Site-specific extraction profiles
+Each profile maps a set of hostnames to one CSS selector per field. Selectors
+are compiled once when the profiles are loaded, so a page from a known site
+costs a handful of targeted lookups instead of the generic selector cascade.
+"""
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from content_cleaner import ContentCleaner
+from rate_limiter import host_for_url
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('title', 'content', 'author', 'date')
+
+# Removed from the content element before its text is taken
+DEFAULT_REMOVE = 'script, style, nav, header, footer, .ads, .advertisement, .wp-block-buttons, .wp-block-columns'
+
+MIN_CONTENT_LENGTH = 100
+
+
+class ExtractionProfile:
+    def __init__(self, name: str, config: Dict):
+        """
+        Compile a profile from its configuration
+
+        Args:
+            name: Profile name (for logging)
+            config: Dictionary with 'hosts', one selector per field in FIELDS,
+                an optional 'remove' selector and an optional 'join' list of
+                fields whose matches are concatenated instead of taking the first,
+                and an optional 'boilerplate' list of phrases removed from the text
+                of this site's articles (in addition to the default phrases)
+        """
+        self.name = name
+        self.hosts: List[str] = [host.lower() for host in config.get('hosts', [])]
+        self.join = set(config.get('join', []))
+        self.selectors = {
+            field: soupsieve.compile(config[field]) for field in FIELDS if config.get(field)
+        }
+        self.remove = soupsieve.compile(config.get('remove', DEFAULT_REMOVE))
+        self.cleaner = ContentCleaner().extend(config['boilerplate']) if config.get('boilerplate') else None
+
+    def extract(self, soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+        """
+        Extract fields with the profile's selectors
+
+        Args:
+            soup: Parsed HTML document
+
+        Returns:
+            Dictionary with every field in FIELDS (None when the selector found nothing)
+        """
+        result = {field: None for field in FIELDS}
+        for field, selector in self.selectors.items():
+            if field in self.join:
+                elements = selector.select(soup)
+            else:
+                element = selector.select_one(soup)
+                elements = [element] if element is not None else []
+            if not elements:
+                continue
+
+            if field == 'content':
+                for element in elements:
+                    for unwanted in self.remove.select(element):
+                        unwanted.decompose()
+            text = '\n'.join(element.get_text().strip() for element in elements).strip()
+            if field == 'content' and len(text) <= MIN_CONTENT_LENGTH:
+                continue
+            result[field] = text or None
+        return result
+
+
+class ProfileRegistry:
+    def __init__(self, profiles: Optional[List[ExtractionProfile]] = None):
+        """
+        Initialize the registry
+
+        Args:
+            profiles: Compiled profiles; hostnames are matched exactly or as a
+                parent domain (arstechnica.com matches feeds.arstechnica.com)
+        """
+        self.profiles = profiles or []
+        self._by_host: Dict[str, ExtractionProfile] = {}
+        for profile in self.profiles:
+            for host in profile.hosts:
+                self._by_host[host[4:] if host.startswith('www.') else host] = profile
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ProfileRegistry':
+        """
+        Load and compile profiles from a JSON file
+
+        Invalid profiles are logged and skipped; a missing file yields an
+        empty registry (every page then uses the generic extractor).
+        """
+        if not os.path.exists(path):
+            logger.info(f"No extraction profiles at {path}, using generic extraction only")
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read extraction profiles {path}: {str(e)}")
+            return cls()
+
+        profiles = []
+        for name, profile_config in config.items():
+            try:
+                profiles.append(ExtractionProfile(name, profile_config))
+            except Exception as e:
+                logger.error(f"Skipping extraction profile '{name}': {str(e)}")
+        logger.info(f"Loaded {len(profiles)} extraction profiles")
+        return cls(profiles)
+
+    def for_url(self, url: str) -> Optional[ExtractionProfile]:
+        """Return the profile for a URL's host (or a parent domain), if any"""
+        host = host_for_url(url)
+        while host:
+            profile = self._by_host.get(host)
+            if profile:
+                return profile
+            _, _, host = host.partition('.')
+        return None
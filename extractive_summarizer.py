@@ -0,0 +1,161 @@
+"""
+Extractive summarizer for the Gmail Article Summarizer
+Scores sentences with TextRank over TF-IDF sentence vectors and keeps the best
+few in their original order. All articles of a run are scored together: their
+sentences share one sparse TF-IDF matrix, the per-article similarity graphs
+form one block-diagonal matrix, and a single power iteration ranks every
+sentence of every article at once.
+"""
+import logging
+import re
+import threading
+from typing import Dict, List
+
+import numpy as np
+from scipy import sparse
+
+from summary_cache import content_hash
+from text_analysis import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# Only the whitespace is consumed; a closing quote or bracket stays with its sentence
+SENTENCE_BOUNDARY = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["”\')\]]))\s+(?=["“\'(\[]?[A-Z0-9])')
+TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences on ., ! or ? followed by a capitalised word"""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+class ExtractiveSummarizer:
+    def __init__(self, num_sentences: int = 3, max_sentences: int = 300, min_words: int = 5,
+                 damping: float = 0.85, iterations: int = 50, memo_size: int = 1024):
+        """
+        Initialize the summarizer
+
+        Args:
+            num_sentences: Sentences kept per summary
+            max_sentences: Only the first sentences of very long articles are scored
+            min_words: Shorter sentences (captions, datelines) are never picked
+            damping: TextRank damping factor
+            iterations: Upper bound on power iterations
+            memo_size: Summaries remembered by text hash (see summarize_many)
+        """
+        self.num_sentences = num_sentences
+        self.max_sentences = max_sentences
+        self.min_words = min_words
+        self.damping = damping
+        self.iterations = iterations
+        self.memo_size = memo_size
+        self._memo: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def summarize(self, text: str) -> str:
+        """Summarize one text, reusing the result of an earlier summarize_many call"""
+        with self._lock:
+            memoized = self._memo.get(content_hash(text))
+        if memoized is not None:
+            return memoized
+        return self.summarize_many([text])[0]
+
+    def summarize_many(self, texts: List[str]) -> List[str]:
+        """
+        Summarize several texts in one batched matrix computation
+
+        Results are remembered, so a later summarize() of the same text is free.
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            One summary per text, in input order
+        """
+        documents = [split_sentences(text)[:self.max_sentences] for text in texts]
+        sentences = [sentence for document in documents for sentence in document]
+        owners = np.repeat(np.arange(len(documents)), [len(document) for document in documents])
+
+        summaries = []
+        if sentences:
+            scores = self._rank(sentences, owners, len(documents))
+            start = 0
+            for document in documents:
+                summaries.append(self._select(document, scores[start:start + len(document)]))
+                start += len(document)
+        else:
+            summaries = [''] * len(texts)
+
+        # Texts without sentence punctuation come back whole; keep them short
+        summaries = [summary if summary else text[:500] + ("..." if len(text) > 500 else "")
+                     for summary, text in zip(summaries, texts)]
+
+        with self._lock:
+            if len(self._memo) + len(texts) > self.memo_size:
+                self._memo.clear()
+            for text, summary in zip(texts, summaries):
+                self._memo[content_hash(text)] = summary
+        return summaries
+
+    def _rank(self, sentences: List[str], owners: np.ndarray, num_documents: int) -> np.ndarray:
+        """Return a TextRank score per sentence; scores are comparable within one document"""
+        # Sparse term-count matrix over the shared vocabulary of the whole batch
+        vocabulary: Dict[str, int] = {}
+        rows, columns = [], []
+        word_counts = np.zeros(len(sentences), dtype=np.int32)
+        for row, sentence in enumerate(sentences):
+            tokens = TOKEN.findall(sentence.lower())
+            word_counts[row] = len(tokens)
+            for token in tokens:
+                if token not in STOPWORDS and len(token) > 1:
+                    rows.append(row)
+                    columns.append(vocabulary.setdefault(token, len(vocabulary)))
+        counts = sparse.csr_matrix((np.ones(len(rows), dtype=np.float64), (rows, columns)),
+                                   shape=(len(sentences), max(1, len(vocabulary))))
+        counts.sum_duplicates()
+
+        # Sublinear TF, smoothed IDF, L2-normalised rows
+        counts.data = 1.0 + np.log(counts.data)
+        document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+        idf = np.log((1.0 + len(sentences)) / (1.0 + document_frequency)) + 1.0
+        tfidf = counts @ sparse.diags(idf)
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        tfidf = sparse.diags(1.0 / norms) @ tfidf
+
+        # Cosine similarity between sentences of the same article only; each
+        # article's block is computed on its own, so cost grows per article
+        # rather than with the square of the batch's sentence count
+        sizes = np.bincount(owners, minlength=num_documents)
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+        similarity = sparse.block_diag(
+            [tfidf[start:end] @ tfidf[start:end].T for start, end in zip(bounds[:-1], bounds[1:])],
+            format='csr')
+        similarity.setdiag(0)
+        similarity.eliminate_zeros()
+
+        # Column-stochastic transition matrix; isolated sentences only teleport
+        out_weight = np.asarray(similarity.sum(axis=0)).ravel()
+        out_weight[out_weight == 0] = 1.0
+        transition = similarity @ sparse.diags(1.0 / out_weight)
+
+        teleport = 1.0 / sizes.astype(np.float64)[owners]
+        scores = teleport.copy()
+        for _ in range(self.iterations):
+            updated = (1.0 - self.damping) * teleport + self.damping * (transition @ scores)
+            if np.abs(updated - scores).max() < 1e-6:
+                scores = updated
+                break
+            scores = updated
+
+        # Sentences too short to stand on their own are never selected
+        scores[word_counts < self.min_words] = -1.0
+        return scores
+
+    def _select(self, document: List[str], scores: np.ndarray) -> str:
+        if not document:
+            return ''
+        if len(document) <= self.num_sentences:
+            return ' '.join(document)
+        best = np.argsort(-scores, kind='stable')[:self.num_sentences]
+        return ' '.join(document[i] for i in sorted(best) if scores[i] >= 0)
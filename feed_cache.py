@@ -0,0 +1,127 @@
+"""
+Persistent conditional-GET cache for RSS feeds
+Stores each feed's ETag / Last-Modified validators together with the parsed
+item list, so an unchanged feed costs one 304 response and no parsing.
+Entries also hold the feed's polling hints and adaptive schedule
+(see feed_schedule.py).
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    def __init__(self, path: str):
+        """
+        Initialize the feed cache
+
+        Args:
+            path: JSON file the cache is loaded from and saved to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._feeds: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.path}: {str(e)}")
+            return {}
+
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers for a feed
+
+        Args:
+            feed_url: URL of the RSS feed
+
+        Returns:
+            Headers to send, empty if the feed has never been cached
+        """
+        with self._lock:
+            entry = self._feeds.get(feed_url)
+            if not entry or entry.get('items') is None:
+                return {}
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def get_items(self, feed_url: str) -> List[Dict]:
+        """Return the cached item list for a feed and record a 304 hit"""
+        with self._lock:
+            entry = self._feeds.get(feed_url, {})
+            entry['checked_at'] = time.time()
+            entry['not_modified'] = entry.get('not_modified', 0) + 1
+            self._dirty = True
+            return list(entry.get('items') or [])
+
+    def store(self, feed_url: str, items: List[Dict], etag: Optional[str] = None,
+              last_modified: Optional[str] = None, **extra) -> int:
+        """
+        Save a freshly downloaded feed
+
+        Args:
+            feed_url: URL of the RSS feed
+            items: Parsed items (dictionaries with at least a 'link')
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            extra: Additional per-feed metadata to keep alongside the items
+
+        Returns:
+            Number of items whose link was not in the previously stored list
+        """
+        with self._lock:
+            entry = self._feeds.setdefault(feed_url, {})
+            known = {item.get('link') for item in entry.get('items') or []}
+            entry.update(extra)
+            entry.update({
+                'etag': etag,
+                'last_modified': last_modified,
+                'items': items,
+                'checked_at': time.time(),
+                'modified': entry.get('modified', 0) + 1
+            })
+            self._dirty = True
+            return sum(1 for item in items if item.get('link') not in known)
+
+    def update(self, feed_url: str, **fields):
+        """Set per-feed metadata (poll schedule, hints) without touching the items"""
+        with self._lock:
+            self._feeds.setdefault(feed_url, {}).update(fields)
+            self._dirty = True
+
+    def stats(self, feed_url: str) -> Dict:
+        """Return the stored metadata for a feed (without the item list)"""
+        with self._lock:
+            entry = self._feeds.get(feed_url, {})
+            return {key: value for key, value in entry.items() if key != 'items'}
+
+    def save(self):
+        """Write the cache to disk if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._feeds, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not save feed cache {self.path}: {str(e)}")
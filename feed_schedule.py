@@ -0,0 +1,173 @@
+"""
+Adaptive polling schedule for RSS feeds
+Each feed gets its own poll interval, learned from what polling it shows:
+- The spacing of its items' publish dates, the feed's own update rate
+- How long it actually took to change between polls (which a feed that
+  mostly answers 304 Not Modified drives up; used when items have no dates)
+- Its <ttl>, the minimum interval the publisher asks for
+- Its <skipHours>/<skipDays>, GMT hours and days it asks not to be polled
+A poll that finds new items resets the interval to the learned update rate,
+so busy feeds are polled often; each poll that finds nothing (or fails)
+doubles it up to max_interval, so quiet feeds back off exponentially.
+
+The state lives in the feed cache entries, so it survives restarts.
+"""
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+
+from bs4 import BeautifulSoup
+
+from feed_cache import FeedCache
+
+logger = logging.getLogger(__name__)
+
+# Most recent items used to estimate a feed's publish rate
+RATE_SAMPLE = 20
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def parse_feed_hints(soup: BeautifulSoup) -> Dict:
+    """
+    Read the RSS channel's polling hints
+
+    Args:
+        soup: Parsed feed document
+
+    Returns:
+        {'ttl': minutes or None, 'skip_hours': [GMT hours], 'skip_days': [weekday names]}
+    """
+    ttl = soup.find('ttl')
+    skip_hours = soup.find('skipHours')
+    skip_days = soup.find('skipDays')
+    hours = [hour.get_text().strip() for hour in skip_hours.find_all('hour')] if skip_hours else []
+    days = [day.get_text().strip().capitalize() for day in skip_days.find_all('day')] if skip_days else []
+    return {
+        'ttl': int(ttl.get_text().strip()) if ttl and ttl.get_text().strip().isdigit() else None,
+        'skip_hours': sorted({int(hour) % 24 for hour in hours if hour.isdigit()}),
+        'skip_days': [day for day in WEEKDAYS if day in days]
+    }
+
+
+def publish_interval(items: Iterable[Dict]) -> Optional[float]:
+    """
+    Average seconds between a feed's most recent items
+
+    Args:
+        items: Feed items with an RFC 822 'published' date (others are ignored)
+
+    Returns:
+        Mean gap between the newest RATE_SAMPLE dated items, or None with fewer than two
+    """
+    stamps = []
+    for item in items:
+        try:
+            published = parsedate_to_datetime(item.get('published') or '')
+        except (TypeError, ValueError):
+            continue
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        stamps.append(published.timestamp())
+    stamps = sorted(stamps, reverse=True)[:RATE_SAMPLE]
+    if len(stamps) < 2 or stamps[0] == stamps[-1]:
+        return None
+    return (stamps[0] - stamps[-1]) / (len(stamps) - 1)
+
+
+def _skip_to_allowed(due: float, skip_hours: List[int], skip_days: List[str]) -> float:
+    """Move a poll out of the feed's skipped GMT hours and days"""
+    moment = datetime.fromtimestamp(due, timezone.utc)
+    for _ in range(24 * 8):
+        if moment.hour not in skip_hours and WEEKDAYS[moment.weekday()] not in skip_days:
+            break
+        moment = moment.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    else:
+        return due  # Every hour is skipped; ignore the hints
+    return max(due, moment.timestamp())
+
+
+class FeedScheduler:
+    def __init__(self, feed_cache: FeedCache, default_interval: float = 1800,
+                 min_interval: float = 300, max_interval: float = 6 * 3600):
+        """
+        Initialize the feed scheduler
+
+        Args:
+            feed_cache: Cache whose entries hold the schedule and the feeds' hints
+            default_interval: Seconds between polls of a feed with nothing learned yet
+            min_interval: Shortest interval for any feed (busy feeds)
+            max_interval: Longest interval after backing off (quiet or failing feeds)
+        """
+        self.feed_cache = feed_cache
+        self.default_interval = default_interval
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+
+    def next_poll(self, feed_url: str) -> float:
+        """Timestamp the feed is due (0 if never polled)"""
+        return self.feed_cache.stats(feed_url).get('next_poll', 0)
+
+    def due(self, feeds: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """Return the feeds due for a poll, in the given order"""
+        now = time.time() if now is None else now
+        return [feed for feed in feeds if self.next_poll(feed) <= now]
+
+    def next_due(self, feeds: Iterable[str]) -> float:
+        """Timestamp the first of the feeds comes due"""
+        return min((self.next_poll(feed) for feed in feeds), default=time.time() + self.default_interval)
+
+    def record(self, feed_url: str, new_items: int, items: List[Dict], failed: bool = False,
+               now: Optional[float] = None) -> float:
+        """
+        Schedule a feed's next poll after polling it
+
+        Args:
+            feed_url: URL of the RSS feed
+            new_items: Items the poll found that were not in the feed before
+            items: The feed's current items
+            failed: The poll failed (network error, HTTP error)
+            now: Time of the poll (default: now)
+
+        Returns:
+            Seconds until the next poll
+        """
+        now = time.time() if now is None else now
+        entry = self.feed_cache.stats(feed_url)
+        interval = entry.get('poll_interval') or self.default_interval
+        change_interval = entry.get('change_interval')
+        changed_at = entry.get('changed_at')
+
+        if new_items and not failed:
+            # Time the feed took to change, smoothed: what 304s and unchanged
+            # feeds measure, and the estimate when items carry no dates
+            if changed_at:
+                gap = now - changed_at
+                change_interval = gap if change_interval is None else (change_interval + gap) / 2
+            changed_at = now
+            interval = publish_interval(items) or change_interval or self.default_interval
+        else:
+            interval *= 2
+
+        floor = max(self.min_interval, (entry.get('ttl') or 0) * 60)
+        interval = min(self.max_interval, max(floor, interval))
+        next_poll = _skip_to_allowed(now + interval, entry.get('skip_hours') or [], entry.get('skip_days') or [])
+        self.feed_cache.update(feed_url, poll_interval=interval, next_poll=next_poll,
+                               change_interval=change_interval, changed_at=changed_at)
+        logger.debug(f"Next poll of {feed_url} in {(next_poll - now) / 60:.0f} min "
+                     f"({new_items} new items{', failed' if failed else ''})")
+        return next_poll - now
+
+    def report(self, feeds: Iterable[str]) -> Dict[str, Dict]:
+        """Return each feed's poll interval (minutes) and share of 304 Not Modified responses"""
+        report = {}
+        for feed in feeds:
+            entry = self.feed_cache.stats(feed)
+            polls = entry.get('modified', 0) + entry.get('not_modified', 0)
+            report[feed] = {
+                'interval_minutes': round((entry.get('poll_interval') or self.default_interval) / 60, 1),
+                'not_modified_rate': entry.get('not_modified', 0) / polls if polls else 0.0
+            }
+        return report
@@ -0,0 +1,132 @@
+"""
+Batched Hugging Face Inference API client
+The inference API accepts a list of inputs, so all articles of a run are
+summarized in a few sized requests instead of one POST per article. When a
+whole batch fails, its items are retried one at a time so a single bad input
+does not cost the rest of the batch their summaries. Rate-limit and
+model-loading responses (429/503) raise BackendUnavailable instead, so the
+caller's circuit breaker can stop further requests.
+"""
+import logging
+import time
+from typing import List, Optional
+
+from circuit_breaker import BackendUnavailable
+from rate_limiter import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
+
+
+class HuggingFaceSummarizer:
+    def __init__(self, http, token: Optional[str], api_url: str = DEFAULT_API_URL,
+                 batch_size: int = 8, timeout: float = 60, max_input_chars: int = 1000):
+        """
+        Initialize the client
+
+        Args:
+            http: PooledHTTPClient (or anything with a requests-style post())
+            token: Hugging Face API token; without one the client is unavailable
+            api_url: Model endpoint, e.g. a local stand-in server for testing
+            batch_size: Articles sent per request
+            timeout: Seconds to wait for one request (a batch or a single item)
+            max_input_chars: Article text is truncated to this many characters
+        """
+        self.http = http
+        self.token = token
+        self.api_url = api_url
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self.max_input_chars = max_input_chars
+
+    @property
+    def available(self) -> bool:
+        return bool(self.token)
+
+    def summarize(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Summarize texts in batches of batch_size
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            One summary per text, in input order; None where summarization failed
+
+        Raises:
+            BackendUnavailable: The endpoint answered 429 or 503
+        """
+        summaries: List[Optional[str]] = []
+        for batch in self.batches(texts):
+            summaries.extend(self.summarize_batch(batch))
+        return summaries
+
+    def batches(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into batches of batch_size"""
+        return [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+
+    def summarize_batch(self, batch: List[str]) -> List[Optional[str]]:
+        """
+        Summarize one batch in a single request, retrying items one at a time if it fails
+
+        Raises:
+            BackendUnavailable: The endpoint answered 429 or 503
+        """
+        batch = [text[:self.max_input_chars] for text in batch]
+        results = self._post(batch)
+        if results is None and len(batch) > 1:
+            logger.warning(f"Hugging Face batch of {len(batch)} failed, retrying items one at a time")
+            results = [(self._post([text]) or [None])[0] for text in batch]
+        return results or [None] * len(batch)
+
+    def _post(self, inputs: List[str]) -> Optional[List[Optional[str]]]:
+        """Send one request; returns per-input summaries, or None if the request failed"""
+        start = time.perf_counter()
+        try:
+            response = self.http.post(
+                self.api_url,
+                headers={"Authorization": f"Bearer {self.token}"},
+                json={"inputs": inputs},
+                timeout=self.timeout
+            )
+            elapsed = time.perf_counter() - start
+            if response.status_code in (429, 503):
+                raise BackendUnavailable(response.status_code, self._retry_after(response))
+            if response.status_code != 200:
+                logger.warning(f"Hugging Face returned HTTP {response.status_code} for "
+                               f"{len(inputs)} input(s) after {elapsed:.2f}s")
+                return None
+            payload = response.json()
+        except BackendUnavailable:
+            raise
+        except Exception as e:
+            logger.warning(f"Hugging Face request for {len(inputs)} input(s) failed: {str(e)}")
+            return None
+
+        if not isinstance(payload, list) or len(payload) != len(inputs):
+            logger.warning(f"Hugging Face returned {type(payload).__name__} for {len(inputs)} input(s), "
+                           f"expected a list of {len(inputs)} results")
+            return None
+
+        summaries = []
+        for item in payload:
+            # Batched pipelines may wrap each result in its own list
+            if isinstance(item, list):
+                item = item[0] if item else None
+            summary = item.get('summary_text') if isinstance(item, dict) else None
+            summaries.append(summary.strip() if summary and summary.strip() else None)
+
+        succeeded = sum(1 for summary in summaries if summary)
+        logger.info(f"Hugging Face batch of {len(inputs)}: {succeeded} summaries in {elapsed:.2f}s")
+        return summaries
+
+    def _retry_after(self, response) -> Optional[float]:
+        """Retry-After header, or the model loading estimate the API puts in 503 bodies"""
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is None:
+            try:
+                retry_after = float(response.json().get('estimated_time'))
+            except (ValueError, TypeError, AttributeError):
+                pass
+        return retry_after
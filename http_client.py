@@ -0,0 +1,142 @@
+"""
+Pooled HTTP client for the Gmail Article Summarizer
+One shared requests.Session with per-host keep-alive connection pools, so
+articles from the same site reuse a TCP+TLS connection instead of opening a
+new one for every request.
+"""
+import logging
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a response body exceeds the configured size limit"""
+
+
+def read_limited(response: requests.Response, max_bytes: int, chunk_size: int = 65536) -> bytes:
+    """
+    Read a streamed response body, aborting once it grows past max_bytes
+
+    Args:
+        response: Response obtained with stream=True
+        max_bytes: Largest (decoded) body accepted
+        chunk_size: Bytes read per network chunk
+
+    Returns:
+        The response body
+    """
+    try:
+        declared = int(response.headers.get('Content-Length', 0))
+        if declared > max_bytes:
+            raise ResponseTooLarge(f"Content-Length {declared} exceeds limit of {max_bytes} bytes")
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size):
+            body += chunk
+            if len(body) > max_bytes:
+                raise ResponseTooLarge(f"Body exceeds limit of {max_bytes} bytes")
+        return bytes(body)
+    finally:
+        response.close()
+
+
+class _ConnectionCountingAdapter(HTTPAdapter):
+    """HTTPAdapter that records requests and newly opened connections per host"""
+
+    def __init__(self, client: 'PooledHTTPClient', **kwargs):
+        self._client = client
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # Swap in pool classes whose connections report every connect (= handshake)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._counting_pool(pool_cls)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def _counting_pool(self, base):
+        client = self._client
+
+        class CountingConnection(base.ConnectionCls):
+            def connect(self):
+                client._record(self.host, 'connections')
+                return super().connect()
+
+        class CountingPool(base):
+            ConnectionCls = CountingConnection
+
+        CountingPool.__name__ = f"Counting{base.__name__}"
+        return CountingPool
+
+    def send(self, request, **kwargs):
+        host = requests.utils.urlparse(request.url).hostname or ''
+        self._client._record(host, 'requests')
+        return super().send(request, **kwargs)
+
+
+class PooledHTTPClient:
+    def __init__(self, pool_size: int = 4, max_hosts: int = 20, headers: Dict = None):
+        """
+        Initialize the pooled HTTP client
+
+        Args:
+            pool_size: Connections kept alive per host (match the worker count)
+            max_hosts: Number of per-host pools cached before the oldest is dropped
+            headers: Default headers sent with every request
+        """
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        self.session = requests.Session()
+        # gzip/deflate always; br as well when the brotli package is installed
+        self.session.headers['Accept-Encoding'] = DEFAULT_ACCEPT_ENCODING
+        self.session.headers['Connection'] = 'keep-alive'
+        if headers:
+            self.session.headers.update(headers)
+
+        adapter = _ConnectionCountingAdapter(
+            self,
+            pool_connections=max_hosts,
+            pool_maxsize=max(1, pool_size),
+            pool_block=False
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _record(self, host: str, counter: str):
+        with self._lock:
+            stats = self._stats.setdefault(host, {'requests': 0, 'connections': 0})
+            stats[counter] += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request over the shared session"""
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request over the shared session"""
+        return self.session.post(url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return per-host request and connection counts
+
+        'connections' is the number of new TCP (and TLS, for https) handshakes;
+        with working keep-alive it stays well below 'requests'.
+        """
+        with self._lock:
+            return {host: dict(stats) for host, stats in self._stats.items()}
+
+    def reset_stats(self):
+        """Clear the per-host counters while keeping open connections"""
+        with self._lock:
+            self._stats.clear()
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
@@ -0,0 +1,81 @@
+"""
+Compiled multi-pattern keyword matcher
+Finds every occurrence of every keyword (including overlapping ones such as
+"data" inside "data science") in a single scan of the text. The keywords are
+folded into a trie and compiled into one regular expression, so the scan runs
+in the regex engine and costs about the same for five keywords or five
+hundred, instead of one substring search per keyword.
+"""
+import re
+from typing import Dict, Iterable, List
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Build a regex that matches the longest trie path from node"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    # Greedy optional tail: a keyword ending here matches unless a longer one does
+    return f'(?:{body})?' if '' in node else body
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = False):
+        """
+        Compile the matcher
+
+        Args:
+            keywords: Keywords or phrases (matched case-insensitively)
+            word_boundary: Only match whole words ("app" does not match "happy")
+        """
+        self.keywords: List[str] = list(dict.fromkeys(k.lower() for k in keywords if k))
+        self.word_boundary = word_boundary
+
+        trie: Dict = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        # Keywords that are prefixes of a longer match start at the same position,
+        # so each match expands to every keyword it starts with
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [other for other in self.keywords if keyword.startswith(other)]
+            for keyword in self.keywords
+        }
+
+        trie_pattern = _trie_pattern(trie) if self.keywords else '(?!)'
+        if word_boundary:
+            self._scanner = re.compile(rf'\b(?=({trie_pattern})\b)')
+            self._boundary = re.compile(r'\w')
+        else:
+            self._scanner = re.compile(f'(?=({trie_pattern}))')
+        self._finder = re.compile(rf'\b(?:{trie_pattern})\b' if word_boundary else trie_pattern)
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """
+        Count the occurrences of each keyword in text
+
+        Args:
+            text: Text to scan (lowercase it first; keywords are lowercase)
+
+        Returns:
+            Keyword -> number of occurrences, for keywords that occur at all
+        """
+        counts: Dict[str, int] = {}
+        for match in self._scanner.finditer(text):
+            longest = match.group(1)
+            start = match.start(1)
+            for keyword in self._prefixes[longest]:
+                if self.word_boundary and keyword is not longest:
+                    end = start + len(keyword)
+                    if end < len(text) and self._boundary.match(text, end):
+                        continue
+                counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+
+    def contains_any(self, text: str) -> bool:
+        """Return whether any keyword occurs in text (stops at the first match)"""
+        return self._finder.search(text) is not None
@@ -0,0 +1,206 @@
+"""
+SMTP delivery for the Gmail Article Summarizer
+Keeps one authenticated SMTP session open and sends every message of a run
+over it, instead of connecting and logging in once per email. Sends are
+throttled to the provider's rate, the session is re-opened when the server
+drops it (or after messages_per_connection messages), and transient failures
+(4xx replies, disconnects, timeouts, refused or reset connections) are
+retried with exponential backoff. Permanent 5xx rejections, other SMTP errors
+and TLS certificate errors fail only the message concerned.
+
+The connection comes from a factory, so a local stand-in server (for example
+``python -m aiosmtpd -n -l localhost:8025``) can replace Gmail in testing.
+"""
+import logging
+import smtplib
+import socket
+import threading
+import time
+from email.message import Message
+from typing import Callable, Dict, Iterable, List, Optional
+
+from rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SMTP_HOST = 'smtp.gmail.com'
+DEFAULT_SMTP_PORT = 465
+
+# Dropped connections, refused or reset connects and timeouts. Not OSError as a
+# whole: every SMTPException is one, and so are TLS certificate failures
+TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether retrying the message later may succeed"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+class MailDelivery:
+    def __init__(self, user: Optional[str], password: Optional[str], host: str = DEFAULT_SMTP_HOST,
+                 port: int = DEFAULT_SMTP_PORT, use_ssl: bool = True, timeout: float = 30,
+                 messages_per_second: float = 1.0, burst: int = 5, messages_per_connection: int = 100,
+                 max_retries: int = 3, backoff: float = 2.0,
+                 connect: Optional[Callable[[], smtplib.SMTP]] = None):
+        """
+        Initialize the mailer
+
+        Args:
+            user: SMTP login (None skips authentication, e.g. for a local stand-in)
+            password: SMTP password (a Gmail app password)
+            host: SMTP server
+            port: SMTP port (465 for SSL, 587 for STARTTLS, 25/8025 for a local server)
+            use_ssl: Connect with SMTP_SSL; otherwise plain SMTP, upgraded with
+                STARTTLS when the server offers it
+            timeout: Socket timeout in seconds
+            messages_per_second: Sustained send rate (stay under the provider's limits)
+            burst: Messages that may be sent back-to-back
+            messages_per_connection: The session is re-opened after this many messages
+            max_retries: Retries per message after a transient failure
+            backoff: Seconds before the first retry, doubled after each one
+            connect: Returns a new, connected smtplib.SMTP-like session (overrides
+                host, port, use_ssl and timeout)
+        """
+        self.user = user
+        self.password = password
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.messages_per_connection = max(1, messages_per_connection)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self._connect = connect or self._default_connect
+        self._limiter = HostRateLimiter(requests_per_second=messages_per_second, burst=burst)
+        self._lock = threading.Lock()
+        self._session: Optional[smtplib.SMTP] = None
+        self._session_messages = 0
+        self.connections = 0
+        self.sent = 0
+        self.retries = 0
+
+    def _default_connect(self) -> smtplib.SMTP:
+        if self.use_ssl:
+            return smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        session = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        session.ehlo()
+        if session.has_extn('starttls'):
+            session.starttls()
+            session.ehlo()
+        return session
+
+    def _open(self) -> smtplib.SMTP:
+        """Return the open session, connecting and logging in if needed"""
+        if self._session is not None and self._session_messages >= self.messages_per_connection:
+            self._close_session()
+        if self._session is None:
+            session = self._connect()
+            try:
+                if self.user:
+                    session.login(self.user, self.password)
+            except Exception:
+                session.close()
+                raise
+            self._session = session
+            self._session_messages = 0
+            self.connections += 1
+            logger.info(f"Opened SMTP session to {self.host}:{self.port}")
+        return self._session
+
+    def _close_session(self):
+        session, self._session = self._session, None
+        if session is None:
+            return
+        try:
+            session.quit()
+        except Exception:
+            session.close()
+
+    def send(self, message: Message) -> bool:
+        """
+        Send one message over the shared session
+
+        Args:
+            message: Complete email message (From/To headers set)
+
+        Returns:
+            True if the server accepted it
+        """
+        return self.send_many([message])[0]
+
+    def send_many(self, messages: Iterable[Message]) -> List[bool]:
+        """
+        Send messages one after another over the shared session
+
+        Args:
+            messages: Complete email messages
+
+        Returns:
+            One flag per message: whether the server accepted it
+        """
+        messages = list(messages)
+        results = []
+        with self._lock:
+            for message in messages:
+                try:
+                    results.append(self._deliver(message))
+                except smtplib.SMTPAuthenticationError as e:
+                    # Every further login would fail too (and may lock the account)
+                    logger.error(f"SMTP login failed, not sending {len(messages) - len(results)} email(s): {str(e)}")
+                    results.extend([False] * (len(messages) - len(results)))
+                    break
+        return results
+
+    def _deliver(self, message: Message) -> bool:
+        """Send one message with retries; raises SMTPAuthenticationError if login fails"""
+        recipient = message.get('To', '')
+        delay = self.backoff
+        attempt = 0
+        while True:
+            self._limiter.acquire(f"smtp://{self.host}")
+            reused = self._session is not None
+            try:
+                self._open().send_message(message)
+                self._session_messages += 1
+                self.sent += 1
+                return True
+            except smtplib.SMTPAuthenticationError:
+                raise
+            except Exception as e:
+                error = e
+
+            # A rejected message leaves the session usable; anything else
+            # (or 421, "closing connection") means reconnecting next time
+            replied = isinstance(error, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused))
+            if not replied or getattr(error, 'smtp_code', None) == 421:
+                self._close_session()
+            if reused and isinstance(error, smtplib.SMTPServerDisconnected):
+                # The server closed an idle session; reconnect right away
+                logger.info(f"SMTP session to {self.host} was closed, reconnecting")
+                continue
+            if not _is_transient(error) or attempt >= self.max_retries:
+                logger.error(f"Could not send email to {recipient}: {str(error)}")
+                return False
+            attempt += 1
+            self.retries += 1
+            logger.warning(f"Sending to {recipient} failed ({str(error)}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            delay *= 2
+
+    def stats(self) -> Dict[str, int]:
+        """Return messages sent, sessions opened and retries since the last reset"""
+        return {'sent': self.sent, 'connections': self.connections, 'retries': self.retries}
+
+    def reset_stats(self):
+        self.sent = 0
+        self.connections = 0
+        self.retries = 0
+
+    def close(self):
+        """Quit the SMTP session"""
+        with self._lock:
+            self._close_session()
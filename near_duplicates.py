@@ -0,0 +1,203 @@
+"""
+Near-duplicate article detection
+Articles are fingerprinted with a 64-bit SimHash of their word 3-grams, so
+syndicated copies of a story (same text, different boilerplate or URL) land
+within a few bits of each other. Fingerprints are indexed by LSH bands: with a
+Hamming threshold of k the 64 bits are cut into k + 1 bands, and any
+fingerprint within k bits must match exactly on at least one band, so a lookup
+only compares against the few fingerprints sharing a band value.
+
+The index of articles already emailed is kept in SQLite between runs.
+"""
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Pure Python bit counting
+    np = None
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+WORD = re.compile(r"[a-z0-9]+")
+_SIGN_BIT = 1 << (FINGERPRINT_BITS - 1)
+
+
+def _shingle_hash(shingle: str) -> int:
+    # Stable across processes, unlike hash()
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def simhash(text: str, shingle_size: int = 3, min_words: int = 30) -> Optional[int]:
+    """
+    Fingerprint a text
+
+    Args:
+        text: Cleaned article text
+        shingle_size: Words per shingle
+        min_words: Shorter texts are not fingerprinted (too little text to tell copies apart)
+
+    Returns:
+        64-bit fingerprint, or None for short texts
+    """
+    words = WORD.findall(text.lower())
+    if len(words) < max(min_words, shingle_size):
+        return None
+    shingles = Counter(' '.join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1))
+    hashes = [_shingle_hash(shingle) for shingle in shingles]
+    weights = list(shingles.values())
+
+    if np is not None:
+        bits = np.unpackbits(np.array(hashes, dtype='<u8').view(np.uint8).reshape(-1, 8),
+                             axis=1, bitorder='little')
+        totals = np.asarray(weights, dtype=np.int64) @ bits
+        half = sum(weights) / 2
+        return sum(1 << bit for bit in np.flatnonzero(totals > half).tolist())
+
+    half = sum(weights) / 2
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        if sum(weight for h, weight in zip(hashes, weights) if h >> bit & 1) > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+class NearDuplicateIndex:
+    def __init__(self, path: Optional[str] = None, max_distance: int = 3, retention_days: float = 30):
+        """
+        Initialize the index
+
+        Args:
+            path: SQLite database file (None keeps the index in memory only)
+            max_distance: Fingerprints within this many differing bits are duplicates
+            retention_days: Entries older than this are forgotten (0 keeps them forever)
+        """
+        self.path = path
+        self.max_distance = max(0, min(max_distance, FINGERPRINT_BITS - 1))
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+
+        # k + 1 bands: a fingerprint within k bits agrees with the query on at least one
+        num_bands = self.max_distance + 1
+        width = FINGERPRINT_BITS // num_bands
+        self._bands: List[Tuple[int, int]] = [
+            (band * width, (1 << (width if band < num_bands - 1 else FINGERPRINT_BITS - band * width)) - 1)
+            for band in range(num_bands)
+        ]
+        self._fingerprints: Dict[str, int] = {}
+        self._buckets: List[Dict[int, List[str]]] = [{} for _ in self._bands]
+
+        self._conn = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints "
+                "(url TEXT PRIMARY KEY, fingerprint INTEGER NOT NULL, seen_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+            self.purge()
+            self._load()
+            logger.info(f"Loaded {len(self._fingerprints)} article fingerprints")
+
+    def purge(self) -> int:
+        """
+        Delete entries older than the retention window
+
+        Returns:
+            Number of entries removed
+        """
+        if not self._conn or not self.retention_days:
+            return 0
+        cutoff = time.time() - self.retention_days * 86400
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM fingerprints WHERE seen_at < ?", (cutoff,))
+            self._conn.commit()
+        if cursor.rowcount:
+            self._load()
+        return cursor.rowcount
+
+    def _load(self):
+        with self._lock:
+            self._fingerprints.clear()
+            self._buckets = [{} for _ in self._bands]
+            # SQLite integers are signed; stored values are mapped back to unsigned
+            for url, stored in self._conn.execute("SELECT url, fingerprint FROM fingerprints"):
+                self._index(url, stored & ((1 << FINGERPRINT_BITS) - 1))
+
+    def _index(self, url: str, fingerprint: int):
+        previous = self._fingerprints.get(url)
+        if previous == fingerprint:
+            return
+        if previous is not None:
+            for (shift, mask), buckets in zip(self._bands, self._buckets):
+                buckets[previous >> shift & mask].remove(url)
+        self._fingerprints[url] = fingerprint
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            buckets.setdefault(fingerprint >> shift & mask, []).append(url)
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """
+        Look up a near-duplicate
+
+        Args:
+            fingerprint: simhash() of the article text
+
+        Returns:
+            URL of an indexed article within max_distance bits, or None
+        """
+        with self._lock:
+            for (shift, mask), buckets in zip(self._bands, self._buckets):
+                for url in buckets.get(fingerprint >> shift & mask, ()):
+                    if hamming_distance(self._fingerprints[url], fingerprint) <= self.max_distance:
+                        return url
+        return None
+
+    def add(self, url: str, fingerprint: int):
+        """Index one article"""
+        self.add_many([(url, fingerprint)])
+
+    def add_many(self, entries: Iterable[Tuple[str, int]]):
+        """
+        Index articles (and store them, for a persistent index)
+
+        Args:
+            entries: (url, fingerprint) pairs
+        """
+        entries = list(entries)
+        if not entries:
+            return
+        with self._lock:
+            for url, fingerprint in entries:
+                self._index(url, fingerprint)
+            if self._conn:
+                now = time.time()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO fingerprints (url, fingerprint, seen_at) VALUES (?, ?, ?)",
+                    [(url, fingerprint - (fingerprint & _SIGN_BIT) * 2, now) for url, fingerprint in entries]
+                )
+                self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
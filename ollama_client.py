@@ -0,0 +1,269 @@
+"""
+Ollama backend for the Gmail Article Summarizer
+Checks that the local Ollama server is up once and caches the answer instead
+of calling /api/tags before every article, keeps the model loaded between
+requests with keep_alive, bounds the number of concurrent generations and
+streams responses so a slow generation can be cut off at a token budget.
+"""
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from circuit_breaker import BackendUnavailable
+from rate_limiter import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+
+
+class OllamaBackend:
+    def __init__(self, http, base_url: str = DEFAULT_BASE_URL, model: str = 'llama2',
+                 keep_alive: str = '30m', max_concurrency: int = 2, max_tokens: int = 200,
+                 timeout: float = 30, health_ttl: float = 300, stream: bool = True):
+        """
+        Initialize the backend
+
+        Args:
+            http: PooledHTTPClient (or anything with requests-style get()/post())
+            base_url: Ollama server address
+            model: Model used for summaries
+            keep_alive: How long Ollama keeps the model loaded after a request
+            max_concurrency: Generations allowed in flight at once
+            max_tokens: Token budget per summary; generation stops once reached
+            timeout: Seconds a single generation may take in total
+            health_ttl: Seconds a health check result is reused
+            stream: Stream tokens (needed for time-to-first-token and early cut-off)
+        """
+        self.http = http
+        self.base_url = base_url.rstrip('/')
+        self.model = model
+        self.keep_alive = keep_alive
+        self.max_tokens = max(1, max_tokens)
+        self.timeout = timeout
+        self.health_ttl = health_ttl
+        self.stream = stream
+        self._slots = threading.Semaphore(max(1, max_concurrency))
+        self._lock = threading.Lock()
+        # Held while probing, so concurrent callers wait for one check instead of each probing
+        self._check_lock = threading.Lock()
+        self._healthy: Optional[bool] = None
+        self._checked_at = 0.0
+        self._warmed = False
+        self._stats: List[Dict] = []
+
+    def _cached_health(self) -> Optional[bool]:
+        with self._lock:
+            if self._healthy is not None and time.monotonic() - self._checked_at < self.health_ttl:
+                return self._healthy
+            return None
+
+    def maybe_available(self) -> bool:
+        """Cheap routing check: False only if a recent health check failed (never probes)"""
+        return self._cached_health() is not False
+
+    def available(self) -> bool:
+        """
+        Return whether Ollama is reachable, checking at most once per health_ttl
+
+        The first successful check also loads the model. Both run outside the
+        lock that summarize() and stats() use.
+        """
+        healthy = self._cached_health()
+        if healthy is not None:
+            return healthy
+        with self._check_lock:
+            # Another thread may have finished a check while this one waited
+            healthy = self._cached_health()
+            if healthy is not None:
+                return healthy
+            healthy = self._check_health()
+            if healthy and not self._warmed:
+                self._warm_up()
+            with self._lock:
+                self._healthy = healthy
+                self._checked_at = time.monotonic()
+            return healthy
+
+    def reset_health(self):
+        """Forget the cached health check so the next call checks again"""
+        with self._lock:
+            self._healthy = None
+
+    def _check_health(self) -> bool:
+        try:
+            response = self.http.get(f"{self.base_url}/api/tags", timeout=5)
+            if response.status_code != 200:
+                logger.info(f"Ollama health check returned HTTP {response.status_code}")
+                return False
+            models = [entry.get('name', '') for entry in response.json().get('models', [])]
+        except Exception:
+            logger.info("Ollama not available")
+            return False
+        if not any(name == self.model or name.split(':')[0] == self.model for name in models):
+            logger.warning(f"Ollama is running but model '{self.model}' is not installed")
+            return False
+        return True
+
+    def _warm_up(self):
+        """Load the model ahead of the first article (an empty prompt only loads it)"""
+        start = time.perf_counter()
+        try:
+            response = self.http.post(f"{self.base_url}/api/generate",
+                                      json={'model': self.model, 'keep_alive': self.keep_alive},
+                                      timeout=self.timeout)
+            if response.status_code == 200:
+                self._warmed = True
+                logger.info(f"Ollama model '{self.model}' loaded in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            logger.warning(f"Ollama warm-up failed: {str(e)}")
+
+    def summarize(self, prompt: str, label: str = '') -> Optional[str]:
+        """
+        Generate a summary, waiting for a free concurrency slot first
+
+        Args:
+            prompt: Full prompt sent to the model
+            label: Shown in the per-generation log line (e.g. the article title)
+
+        Returns:
+            The generated text, or None if the request failed
+
+        Raises:
+            BackendUnavailable: The server answered 429 or 503
+        """
+        if not self.available():
+            return None
+        with self._slots:
+            try:
+                if self.stream:
+                    text, stats = self._generate_streaming(prompt)
+                else:
+                    text, stats = self._generate(prompt)
+            except BackendUnavailable:
+                raise
+            except requests.ConnectionError as e:
+                logger.warning(f"Ollama connection failed: {str(e)}")
+                # The server went away; check again before the next article
+                self.reset_health()
+                return None
+            except Exception as e:
+                logger.warning(f"Ollama generation failed: {str(e)}")
+                return None
+        if not text:
+            return None
+        with self._lock:
+            self._stats.append(stats)
+        logger.info(f"Ollama{f' [{label}]' if label else ''}: {stats['tokens']} tokens, "
+                    f"first token {stats['first_token_seconds']:.2f}s, {stats['tokens_per_second']:.1f} tokens/s"
+                    + (" (cut off at budget)" if stats['truncated'] else ""))
+        return text
+
+    def _request_body(self, prompt: str, stream: bool) -> Dict:
+        return {
+            'model': self.model,
+            'prompt': prompt,
+            'stream': stream,
+            'keep_alive': self.keep_alive,
+            'options': {'num_predict': self.max_tokens}
+        }
+
+    def _check_status(self, response):
+        """Raise BackendUnavailable for an overloaded server, HTTPError for other errors"""
+        if response.status_code in (429, 503):
+            raise BackendUnavailable(response.status_code,
+                                     parse_retry_after(response.headers.get('Retry-After')))
+        response.raise_for_status()
+
+    def _generate(self, prompt: str):
+        start = time.perf_counter()
+        response = self.http.post(f"{self.base_url}/api/generate",
+                                  json=self._request_body(prompt, False), timeout=self.timeout)
+        self._check_status(response)
+        data = response.json()
+        elapsed = time.perf_counter() - start
+        tokens = data.get('eval_count', 0)
+        eval_seconds = data.get('eval_duration', 0) / 1e9
+        return data.get('response', '').strip(), {
+            'tokens': tokens,
+            # Without streaming the first token arrives with the whole response
+            'first_token_seconds': elapsed,
+            'tokens_per_second': tokens / eval_seconds if eval_seconds else 0.0,
+            'truncated': False
+        }
+
+    def _generate_streaming(self, prompt: str):
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        first_token_at = None
+        parts = []
+        tokens = 0
+        truncated = False
+        eval_count = eval_seconds = None
+
+        response = self.http.post(f"{self.base_url}/api/generate", json=self._request_body(prompt, True),
+                                  timeout=self.timeout, stream=True)
+        try:
+            self._check_status(response)
+            # chunk_size=None hands over each token as it arrives instead of buffering
+            for line in response.iter_lines(chunk_size=None):
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    raise RuntimeError(chunk['error'])
+                if chunk.get('response'):
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    parts.append(chunk['response'])
+                    tokens += 1
+                if chunk.get('done'):
+                    eval_count = chunk.get('eval_count')
+                    eval_seconds = chunk.get('eval_duration', 0) / 1e9
+                    break
+                if tokens >= self.max_tokens or time.perf_counter() > deadline:
+                    truncated = True
+                    break
+        finally:
+            response.close()
+
+        end = time.perf_counter()
+        text = ''.join(parts).strip()
+        if truncated and '. ' in text:
+            # Drop the unfinished last sentence
+            text = text[:text.rindex('. ') + 1]
+        if eval_count and eval_seconds:
+            tokens, rate = eval_count, eval_count / eval_seconds
+        else:
+            # Rate over the gaps between tokens, excluding prompt processing
+            generating = end - first_token_at if first_token_at else 0.0
+            rate = (tokens - 1) / generating if generating and tokens > 1 else 0.0
+        return text, {
+            'tokens': tokens,
+            'first_token_seconds': (first_token_at or end) - start,
+            'tokens_per_second': rate,
+            'truncated': truncated
+        }
+
+    def stats(self) -> Dict:
+        """Return generation count and average latency figures since the last reset"""
+        with self._lock:
+            samples = list(self._stats)
+        if not samples:
+            return {'generations': 0, 'avg_first_token_seconds': 0.0, 'avg_tokens_per_second': 0.0,
+                    'truncated': 0}
+        return {
+            'generations': len(samples),
+            'avg_first_token_seconds': round(sum(s['first_token_seconds'] for s in samples) / len(samples), 3),
+            'avg_tokens_per_second': round(sum(s['tokens_per_second'] for s in samples) / len(samples), 1),
+            'truncated': sum(1 for s in samples if s['truncated'])
+        }
+
+    def reset_stats(self):
+        """Clear the per-generation figures"""
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,154 @@
+"""
+Per-host rate limiting for the Gmail Article Summarizer
+Keeps one token bucket per domain so different sites can be fetched in parallel
+while each individual site is only hit at a polite rate.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def host_for_url(url: str) -> str:
+    """Return the bucket key for a URL (lowercased hostname without 'www.')"""
+    host = (urlparse(url).hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Number of seconds to wait, or None if the header is missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter:
+    def __init__(self, requests_per_second: float = 0.5, burst: int = 2,
+                 default_backoff: float = 30.0, max_backoff: float = 300.0):
+        """
+        Initialize the per-host rate limiter
+
+        Args:
+            requests_per_second: Sustained request rate allowed for each host
+                (0 = unlimited; 429/503 backoffs still apply)
+            burst: Number of requests a host may receive back-to-back
+            default_backoff: Seconds to pause a host after a 429 without Retry-After
+            max_backoff: Upper bound for any single pause requested by a server
+        """
+        if requests_per_second < 0:
+            raise ValueError(f"requests_per_second must be 0 (unlimited) or more, got {requests_per_second}")
+        self.rate = requests_per_second
+        self.burst = max(1, burst)
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict] = {}
+
+    def _bucket(self, host: str, now: float) -> Dict:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = {
+                'tokens': float(self.burst),
+                'updated': now,
+                'blocked_until': 0.0,
+                'requests': 0,
+                'throttled_seconds': 0.0,
+                'backoffs': 0
+            }
+            self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to the URL's host is allowed
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            Number of seconds the caller was throttled
+        """
+        host = host_for_url(url)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+
+            # Refill, then reserve a token; a negative balance queues later callers
+            wait = max(bucket['blocked_until'] - now, 0.0)
+            if self.rate:
+                bucket['tokens'] = min(self.burst, bucket['tokens'] + (now - bucket['updated']) * self.rate)
+                bucket['updated'] = now
+                if bucket['tokens'] < 1:
+                    wait = max(wait, (1 - bucket['tokens']) / self.rate)
+                bucket['tokens'] -= 1
+            bucket['requests'] += 1
+            bucket['throttled_seconds'] += wait
+
+        if wait > 0:
+            logger.debug(f"Throttling {host} for {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def backoff(self, url: str, retry_after: Optional[float] = None):
+        """
+        Pause all requests to the URL's host (after a 429/503 response)
+
+        Args:
+            url: URL that was rate limited
+            retry_after: Seconds requested by the server, if any
+        """
+        host = host_for_url(url)
+        delay = min(retry_after if retry_after is not None else self.default_backoff, self.max_backoff)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            bucket['blocked_until'] = max(bucket['blocked_until'], now + delay)
+            # Drain the bucket so exactly one token is available when the pause ends
+            bucket['tokens'] = 1 - (bucket['blocked_until'] - now) * self.rate
+            bucket['updated'] = now
+            bucket['backoffs'] += 1
+        logger.warning(f"{host} asked us to back off, pausing requests for {delay:.1f}s")
+
+    def throttle_report(self) -> Dict[str, Dict]:
+        """Return per-host request counts, throttled seconds and backoffs"""
+        with self._lock:
+            return {
+                host: {
+                    'requests': bucket['requests'],
+                    'throttled_seconds': round(bucket['throttled_seconds'], 2),
+                    'backoffs': bucket['backoffs']
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+    def reset_stats(self):
+        """Clear the per-host counters while keeping bucket state"""
+        with self._lock:
+            for bucket in self._buckets.values():
+                bucket['requests'] = 0
+                bucket['throttled_seconds'] = 0.0
+                bucket['backoffs'] = 0
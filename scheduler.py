@@ -0,0 +1,122 @@
+"""
+In-process job scheduler for daemon mode
+Runs jobs one at a time on the calling thread: fixed-interval jobs (feed
+polling) and jobs at set times of day (sending digests). Waiting is done on a
+threading.Event in short slices, so stop() - called directly or from a
+SIGTERM/SIGINT handler - ends the loop within a second, after the job that
+is running has finished. A failing job is logged and scheduled again.
+"""
+import heapq
+import itertools
+import logging
+import signal
+import threading
+import time
+from datetime import datetime, time as time_of_day, timedelta
+from typing import Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Longest single wait; keeps Ctrl+C responsive on Windows, where waits are not interrupted
+_WAIT_SLICE = 1.0
+
+
+def parse_times(value: str) -> List[time_of_day]:
+    """
+    Parse a comma-separated list of HH:MM times
+
+    Args:
+        value: For example "08:00,18:30" (empty for none)
+
+    Returns:
+        Times of day in order; invalid entries are logged and skipped
+    """
+    times = []
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            times.append(datetime.strptime(part, '%H:%M').time())
+        except ValueError:
+            logger.error(f"Ignoring invalid time {part!r} (expected HH:MM)")
+    return sorted(set(times))
+
+
+def next_daily(times: Iterable[time_of_day], now: float) -> float:
+    """Return the timestamp of the first of the daily times after now"""
+    current = datetime.fromtimestamp(now)
+    candidates = []
+    for at in times:
+        candidate = datetime.combine(current.date(), at)
+        if candidate <= current:
+            candidate += timedelta(days=1)
+        candidates.append(candidate)
+    return min(candidates).timestamp()
+
+
+class Scheduler:
+    def __init__(self):
+        """Initialize an empty scheduler"""
+        # (due timestamp, insertion order, name, job, next due after a run)
+        self._jobs: List[Tuple[float, int, str, Callable[[], object], Callable[[float], float]]] = []
+        self._order = itertools.count()
+        self._stop = threading.Event()
+
+    def add(self, name: str, job: Callable[[], object], next_due: Callable[[float], float],
+            first_due: Optional[float] = None):
+        """
+        Schedule a job
+
+        Args:
+            name: Shown in logs
+            job: Called with no arguments
+            next_due: Given the current timestamp after a run, returns when to run next
+            first_due: Timestamp of the first run (default: next_due(now))
+        """
+        due = first_due if first_due is not None else next_due(time.time())
+        heapq.heappush(self._jobs, (due, next(self._order), name, job, next_due))
+
+    def every(self, seconds: float, job: Callable[[], object], name: str, run_now: bool = True):
+        """Run a job every `seconds` (counted from the end of the previous run)"""
+        seconds = max(1.0, seconds)
+        self.add(name, job, lambda now: now + seconds, time.time() if run_now else None)
+
+    def daily(self, times: Iterable[time_of_day], job: Callable[[], object], name: str):
+        """Run a job each day at the given local times"""
+        times = list(times)
+        if times:
+            self.add(name, job, lambda now: next_daily(times, now))
+
+    def run(self):
+        """Run jobs as they come due until stop() is called"""
+        logger.info(f"Scheduler started with {len(self._jobs)} job(s)")
+        while self._jobs and not self._stop.is_set():
+            due, _, name, job, next_due = self._jobs[0]
+            if due > time.time():
+                logger.debug(f"Next job: {name} at {datetime.fromtimestamp(due):%Y-%m-%d %H:%M:%S}")
+            while not self._stop.is_set() and due > time.time():
+                self._stop.wait(min(_WAIT_SLICE, due - time.time()))
+            if self._stop.is_set():
+                break
+            heapq.heappop(self._jobs)
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Scheduled job {name} failed: {str(e)}")
+            heapq.heappush(self._jobs, (next_due(time.time()), next(self._order), name, job, next_due))
+        logger.info("Scheduler stopped")
+
+    def stop(self):
+        """Make run() return once the current job (if any) has finished"""
+        self._stop.set()
+
+    def handle_signals(self):
+        """Stop on SIGTERM, SIGINT (Ctrl+C) and, on Windows, SIGBREAK; call from the main thread"""
+        def handler(signum, frame):
+            logger.info(f"Received signal {signum}, shutting down after the current job")
+            self.stop()
+
+        for name in ('SIGTERM', 'SIGINT', 'SIGBREAK'):
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), handler)
@@ -0,0 +1,188 @@
+"""
+Persistent index of articles that have already been emailed
+Backed by SQLite with an in-memory set of normalized URLs, so checking a URL
+costs one hash lookup and already-sent articles are never fetched again.
+Pages that could not be used (download or extraction failed, too short) are
+recorded too and skipped until a retry time that doubles with each failure.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only identify the referrer, never the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'ref_src',
+    'cmpid', 'ncid', 'sr_share', 'guccounter', 'guce_referrer', 'guce_referrer_sig',
+    'icid', 'mbid'
+}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize an article URL for de-duplication
+
+    Lowercases scheme and host, drops 'www.', the fragment, utm_* and other
+    tracking parameters, sorts the remaining query and strips a trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(sorted(query)), ''))
+
+
+class SeenArticleStore:
+    def __init__(self, path: str, retention_days: float = 30, failed_retry_hours: float = 6):
+        """
+        Initialize the seen-article store
+
+        Args:
+            path: SQLite database file
+            retention_days: Entries older than this are forgotten (0 keeps them forever)
+            failed_retry_hours: A failed page is skipped this long, doubled after each
+                further failure up to retention_days (0 never skips failed pages)
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self.failed_retry_hours = failed_retry_hours
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_articles (url TEXT PRIMARY KEY, seen_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS failed_articles "
+            "(url TEXT PRIMARY KEY, failures INTEGER NOT NULL, failed_at REAL NOT NULL, retry_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._seen: Set[str] = set()
+        # Normalized URL -> (consecutive failures, timestamp it may be fetched again)
+        self._failed: Dict[str, Tuple[int, float]] = {}
+        self.purge()
+        self._load()
+        logger.info(f"Loaded {len(self._seen)} previously sent articles and {len(self._failed)} failed pages")
+
+    def purge(self) -> int:
+        """
+        Delete entries older than the retention window
+
+        Failed pages are forgotten once they are due for a retry and their last
+        failure is older than the retention window.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.retention_days:
+            return 0
+        now = time.time()
+        cutoff = now - self.retention_days * 86400
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM seen_articles WHERE seen_at < ?", (cutoff,)).rowcount
+            removed += self._conn.execute("DELETE FROM failed_articles WHERE failed_at < ? AND retry_at <= ?",
+                                          (cutoff, now)).rowcount
+            self._conn.commit()
+        if removed:
+            self._load()
+        return removed
+
+    def _load(self):
+        with self._lock:
+            self._seen = {row[0] for row in self._conn.execute("SELECT url FROM seen_articles")}
+            self._failed = {row[0]: (row[1], row[2]) for row in
+                            self._conn.execute("SELECT url, failures, retry_at FROM failed_articles")}
+
+    def _is_skipped(self, key: str, now: float) -> bool:
+        failed = self._failed.get(key)
+        return key in self._seen or (failed is not None and failed[1] > now)
+
+    def is_seen(self, url: str) -> bool:
+        """Check whether an article URL has already been sent or recently failed"""
+        return self._is_skipped(normalize_url(url), time.time())
+
+    def filter_unseen(self, urls: Iterable[str]) -> List[str]:
+        """
+        Drop URLs that were already sent or failed recently, and duplicates that normalize the same
+
+        Args:
+            urls: Candidate article URLs in priority order
+
+        Returns:
+            Unseen URLs, in their original order
+        """
+        now = time.time()
+        unseen = []
+        batch: Set[str] = set()
+        for url in urls:
+            key = normalize_url(url)
+            if self._is_skipped(key, now) or key in batch:
+                continue
+            batch.add(key)
+            unseen.append(url)
+        return unseen
+
+    def mark_seen(self, urls: Iterable[str]):
+        """Record article URLs as sent"""
+        now = time.time()
+        keys = {normalize_url(url) for url in urls}
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles (url, seen_at) VALUES (?, ?)",
+                [(key, now) for key in keys]
+            )
+            self._conn.executemany("DELETE FROM failed_articles WHERE url = ?", [(key,) for key in keys])
+            self._conn.commit()
+            self._seen.update(keys)
+            for key in keys:
+                self._failed.pop(key, None)
+
+    def mark_failed(self, urls: Iterable[str]):
+        """
+        Record pages that could not be used, so they are not fetched again until their retry time
+
+        Args:
+            urls: Article URLs whose download or extraction failed
+        """
+        if not self.failed_retry_hours:
+            return
+        now = time.time()
+        keys = {normalize_url(url) for url in urls}
+        if not keys:
+            return
+        longest = self.retention_days * 86400 if self.retention_days else float('inf')
+        with self._lock:
+            rows = []
+            for key in keys:
+                failures = self._failed.get(key, (0, 0))[0] + 1
+                delay = min(longest, self.failed_retry_hours * 3600 * 2 ** min(failures - 1, 16))
+                rows.append((key, failures, now, now + delay))
+                self._failed[key] = (failures, now + delay)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO failed_articles (url, failures, failed_at, retry_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+        logger.debug(f"Recorded {len(rows)} failed pages")
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,174 @@
+"""
+Subscribers with their own keywords and relevance threshold
+Articles are scraped and summarized once per run. Every subscriber's keywords
+are folded into one KeywordMatcher, so each article is scanned a single time
+for all of them. A subscriber's relevance score for every article is then one
+matrix product: (articles x keywords present) times (keywords x subscribers).
+The cost grows with the number of articles, and adding a subscriber adds a
+column rather than another pass over the text.
+
+Scores use the same scale as the summarizer's own relevance score: 5, plus
+one per matching keyword, plus one for articles over 1000 and one more for
+articles over 2000 words, capped at 10.
+"""
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Tuple
+
+from keyword_matcher import KeywordMatcher
+
+try:
+    import numpy as np
+except ImportError:  # Pure Python scoring
+    np = None
+
+logger = logging.getLogger(__name__)
+
+BASE_SCORE = 5
+MAX_SCORE = 10
+
+
+def length_bonus(word_count: int) -> int:
+    """Relevance points for long articles"""
+    return (word_count > 1000) + (word_count > 2000)
+
+
+class Subscriber:
+    def __init__(self, email: str, keywords: Iterable[str], min_score: int = BASE_SCORE):
+        """
+        Initialize a subscriber
+
+        Args:
+            email: Address the digest is sent to
+            keywords: Keywords or phrases the subscriber cares about (a keyword
+                listed twice counts twice, as in the summarizer's own score)
+            min_score: Articles scoring below this are left out of their digest
+        """
+        self.email = email
+        self.keywords: List[str] = [keyword.lower() for keyword in keywords if keyword]
+        self.min_score = min_score
+
+
+def load_subscribers(path: str, default_keywords: Iterable[str] = (),
+                     default_min_score: int = BASE_SCORE) -> List[Subscriber]:
+    """
+    Load subscribers from a JSON file
+
+    The file holds a list of {"email": ..., "keywords": [...], "min_score": N}
+    objects; keywords and min_score fall back to the defaults. Invalid entries
+    (including keywords that are not a list of strings) are logged and
+    skipped; a missing or unreadable file yields no subscribers.
+    """
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not read subscribers {path}: {str(e)}")
+        return []
+
+    default_keywords = list(default_keywords)
+    subscribers = []
+    for entry in config if isinstance(config, list) else []:
+        try:
+            keywords = entry.get('keywords')
+            # A string would otherwise be taken one character at a time
+            if keywords is not None and (not isinstance(keywords, list)
+                                         or not all(isinstance(keyword, str) for keyword in keywords)):
+                raise TypeError(f"keywords must be a list of strings, not {keywords!r}")
+            subscribers.append(Subscriber(entry['email'], keywords or default_keywords,
+                                          int(entry.get('min_score', default_min_score))))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Skipping subscriber entry {entry!r}: {str(e)}")
+    logger.info(f"Loaded {len(subscribers)} subscribers")
+    return subscribers
+
+
+def default_subscribers(emails: Iterable[str], keywords: Iterable[str],
+                        min_score: int = BASE_SCORE) -> List[Subscriber]:
+    """One subscriber per address, all sharing the same keywords and threshold"""
+    keywords = list(keywords)
+    return [Subscriber(email, keywords, min_score) for email in emails]
+
+
+class SubscriberScorer:
+    def __init__(self, subscribers: List[Subscriber]):
+        """
+        Compile the subscribers' keywords into one matcher and a weight matrix
+
+        Args:
+            subscribers: Subscribers to score articles for
+        """
+        self.subscribers = subscribers
+        self.vocabulary: List[str] = list(dict.fromkeys(
+            keyword for subscriber in subscribers for keyword in subscriber.keywords
+        ))
+        self.matcher = KeywordMatcher(self.vocabulary)
+        self._column = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+        # weights[k][s]: times keyword k appears in subscriber s's list
+        self._weights = [[0] * len(subscribers) for _ in self.vocabulary]
+        for s, subscriber in enumerate(subscribers):
+            for keyword in subscriber.keywords:
+                self._weights[self._column[keyword]][s] += 1
+        self._min_scores = [subscriber.min_score for subscriber in subscribers]
+        if np is not None:
+            self._weights = np.array(self._weights, dtype=np.int32).reshape(len(self.vocabulary), len(subscribers))
+            self._min_scores = np.array(self._min_scores)
+
+    def scores(self, texts: List[str], word_counts: List[int]):
+        """
+        Score every article for every subscriber
+
+        Args:
+            texts: Lowercased article texts
+            word_counts: Words in each article
+
+        Returns:
+            articles x subscribers scores (a NumPy array, or nested lists without NumPy)
+        """
+        present = [[0] * len(self.vocabulary) for _ in texts]
+        for row, text in zip(present, texts):
+            for keyword in self.matcher.counts(text):
+                row[self._column[keyword]] = 1
+        base = [BASE_SCORE + length_bonus(word_count) for word_count in word_counts]
+
+        if np is not None:
+            present = np.array(present, dtype=np.int32).reshape(len(texts), len(self.vocabulary))
+            scores = present @ self._weights + np.array(base, dtype=np.int32).reshape(-1, 1)
+            return np.minimum(scores, MAX_SCORE)
+        return [
+            [min(MAX_SCORE, b + sum(p * w[s] for p, w in zip(row, self._weights) if p))
+             for s in range(len(self.subscribers))]
+            for row, b in zip(present, base)
+        ]
+
+    def digests(self, texts: List[str], word_counts: List[int]) -> Dict[Tuple[Tuple[int, int], ...], List[Subscriber]]:
+        """
+        Pick each subscriber's articles, grouping subscribers whose digests are identical
+
+        Args:
+            texts: Lowercased article texts
+            word_counts: Words in each article
+
+        Returns:
+            ((article index, score), ...) in article order -> subscribers receiving
+            exactly that digest; subscribers with no article above their threshold
+            are left out
+        """
+        scores = self.scores(texts, word_counts)
+        groups: Dict[Tuple[Tuple[int, int], ...], List[Subscriber]] = {}
+        if np is not None:
+            selected = (scores >= self._min_scores).T
+            scores = scores.T.tolist()
+        else:
+            scores = [list(column) for column in zip(*scores)] if scores else [[] for _ in self.subscribers]
+            selected = [[score >= subscriber.min_score for score in column]
+                        for column, subscriber in zip(scores, self.subscribers)]
+        for subscriber, keep, column in zip(self.subscribers, selected, scores):
+            selection = tuple((i, column[i]) for i, chosen in enumerate(keep) if chosen)
+            if selection:
+                groups.setdefault(selection, []).append(subscriber)
+        return groups
+
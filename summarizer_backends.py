@@ -0,0 +1,213 @@
+"""
+Summarizer backend registry with quality-floor routing
+Each backend reports whether it is available and the registry keeps its
+rolling latency and error rate. Every backend has a circuit breaker, opened by
+consecutive failures, rate-limit statuses or a high error rate, so one dead
+API no longer adds its full timeout to every article. Among healthy backends
+that meet the quality floor the cheapest is tried first: the lowest quality
+that meets the floor, in-process before remote. Routing never depends on
+measured latency, so every article of a run (and of later runs) gets the
+same backend while the healthy set is unchanged.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from circuit_breaker import BackendUnavailable, CircuitBreaker, load_breakers, save_breakers
+
+logger = logging.getLogger(__name__)
+
+
+class SummarizerBackend:
+    def __init__(self, name: str, summarize: Callable[[Dict], Optional[Dict]], quality: int,
+                 available: Callable[[], bool] = None, ready: Callable[[], bool] = None,
+                 in_process: bool = False, window: int = 10):
+        """
+        Initialize a backend
+
+        Args:
+            name: Name stored with each summary (e.g. 'huggingface')
+            summarize: Called with article data; returns summary data or None on failure
+            quality: Higher is better; the router skips backends below the floor
+            available: Cheap check whether the backend can be used at all (e.g. a
+                token is configured); None means always available
+            ready: Expensive check (e.g. a health probe) run only when the backend
+                is about to be used; None means always ready
+            in_process: Runs locally without a server; preferred over others of equal quality
+            window: Recent calls the latency and error rate are computed over
+        """
+        self.name = name
+        self.summarize = summarize
+        self.quality = quality
+        self._available = available
+        self._ready = ready
+        self.in_process = in_process
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.breaker: Optional[CircuitBreaker] = None
+
+    def available(self) -> bool:
+        return self._available is None or bool(self._available())
+
+    def ready(self) -> bool:
+        return self._ready is None or bool(self._ready())
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Mean seconds per successful call over the window, None before the first"""
+        return sum(self.latencies) / len(self.latencies) if self.latencies else None
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class BackendRegistry:
+    def __init__(self, quality_floor: int = 0, max_error_rate: float = 0.5,
+                 min_calls: int = 4, cooldown: float = 300, failure_threshold: int = 3,
+                 state_path: Optional[str] = None):
+        """
+        Initialize the registry
+
+        Args:
+            quality_floor: Backends below this quality are only used as a last resort
+            max_error_rate: Error rate at which a backend's breaker is opened
+            min_calls: Calls in the window before the error rate is trusted
+            cooldown: Seconds a breaker stays open before a trial call
+            failure_threshold: Consecutive failures that open a breaker
+            state_path: JSON file breaker state is kept in between runs (None
+                keeps it in memory only)
+        """
+        self.quality_floor = quality_floor
+        self.max_error_rate = max_error_rate
+        self.min_calls = max(1, min_calls)
+        self.cooldown = cooldown
+        self.failure_threshold = failure_threshold
+        self.state_path = state_path
+        self._backends: Dict[str, SummarizerBackend] = {}
+        self._lock = threading.Lock()
+
+    def register(self, backend: SummarizerBackend):
+        """Add a backend; registration order breaks ties between unmeasured backends"""
+        backend.breaker = CircuitBreaker(backend.name, failure_threshold=self.failure_threshold,
+                                         reset_timeout=self.cooldown)
+        load_breakers(self.state_path, [backend.breaker])
+        self._backends[backend.name] = backend
+
+    def save(self):
+        """Persist breaker state if a state_path was given"""
+        save_breakers(self.state_path, [backend.breaker for backend in self._backends.values()])
+
+    def get(self, name: str) -> Optional[SummarizerBackend]:
+        return self._backends.get(name)
+
+    def is_healthy(self, name: str) -> bool:
+        """Return whether a backend is available and its breaker would let a call through"""
+        backend = self._backends.get(name)
+        return backend is not None and backend.breaker.available() and backend.available()
+
+    def first_ready(self, exclude: Tuple[str, ...] = ()) -> Optional[SummarizerBackend]:
+        """Return the first routed backend that passes its readiness check (later ones are not checked)"""
+        return next((backend for backend in self.route(exclude) if backend.ready()), None)
+
+    def acquire(self, name: str) -> bool:
+        """Reserve a call through a backend's breaker (the single trial when half-open)"""
+        return self._backends[name].breaker.acquire()
+
+    def route(self, exclude: Tuple[str, ...] = ()) -> List[SummarizerBackend]:
+        """
+        Order the healthy backends for one article
+
+        Backends meeting the quality floor come first: a higher quality than the
+        floor asks for is only tried after the lower ones, and in-process backends
+        before servers of the same quality (ties keep registration order).
+        Backends below the floor follow, best quality first.
+
+        Args:
+            exclude: Names of backends to leave out
+
+        Returns:
+            Backends to try, in order
+        """
+        candidates = [backend for name, backend in self._backends.items()
+                      if name not in exclude and self.is_healthy(name)]
+        with self._lock:
+            preferred = [b for b in candidates if b.quality >= self.quality_floor]
+            preferred.sort(key=lambda b: (b.quality, not b.in_process))
+            fallback = sorted((b for b in candidates if b.quality < self.quality_floor),
+                              key=lambda b: -b.quality)
+        return preferred + fallback
+
+    def record(self, name: str, seconds: float, success: bool,
+               error: Optional[BackendUnavailable] = None):
+        """
+        Record the outcome of one call
+
+        Args:
+            name: Backend name
+            seconds: Time the call took (per article for batched calls)
+            success: Whether a summary was produced
+            error: Set when the endpoint reported itself unavailable (429/503)
+        """
+        backend = self._backends[name]
+        with self._lock:
+            backend.outcomes.append(success)
+            if success:
+                backend.latencies.append(seconds)
+            error_rate = backend.error_rate
+            unhealthy = len(backend.outcomes) >= self.min_calls and error_rate >= self.max_error_rate
+            if unhealthy:
+                # Start from a clean window once the breaker lets calls through again
+                backend.outcomes.clear()
+        if success:
+            backend.breaker.record_success()
+        elif error is not None:
+            backend.breaker.record_failure(error.status_code, error.retry_after)
+        else:
+            backend.breaker.record_failure()
+        if unhealthy:
+            backend.breaker.trip(f"{error_rate:.0%} of recent calls failed")
+
+    def summarize(self, article_data: Dict, exclude: Tuple[str, ...] = ()) -> Optional[Tuple[str, Dict]]:
+        """
+        Summarize with the first routed backend that succeeds
+
+        Args:
+            article_data: Article data dictionary
+            exclude: Names of backends to leave out
+
+        Returns:
+            (backend name, summary data), or None if every backend failed
+        """
+        for backend in self.route(exclude):
+            # Readiness is only checked for backends actually reached
+            if not backend.ready() or not backend.breaker.acquire():
+                continue
+            start = time.perf_counter()
+            error = None
+            try:
+                summary_data = backend.summarize(article_data)
+            except BackendUnavailable as e:
+                logger.warning(f"Summarizer backend '{backend.name}' unavailable: {str(e)}")
+                summary_data, error = None, e
+            except Exception as e:
+                logger.warning(f"Summarizer backend '{backend.name}' raised: {str(e)}")
+                summary_data = None
+            self.record(backend.name, time.perf_counter() - start, bool(summary_data), error)
+            if summary_data:
+                return backend.name, summary_data
+        return None
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return rolling latency, error rate and breaker state per backend"""
+        with self._lock:
+            return {
+                name: {
+                    'latency': round(backend.latency, 3) if backend.latency is not None else None,
+                    'error_rate': round(backend.error_rate, 2),
+                    'breaker': backend.breaker.state
+                }
+                for name, backend in self._backends.items()
+            }
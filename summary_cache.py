@@ -0,0 +1,121 @@
+"""
+Content-addressed cache of article summaries
+Summaries are keyed by a hash of the cleaned article text, so the same story
+reached through a different URL (e.g. a feedburner mirror) is never
+summarized twice.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content: str) -> str:
+    """Return the cache key for a piece of cleaned article text"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class SummaryCache:
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1000):
+        """
+        Initialize the summary cache
+
+        Args:
+            path: JSON file to persist the cache to (None keeps it in memory only)
+            max_entries: Least recently used entries are evicted beyond this size
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable summary cache {self.path}: {str(e)}")
+            return
+        # Stored oldest-first, so the most recently used entries survive trimming
+        for key, entry in list(entries.items())[-self.max_entries:]:
+            self._entries[key] = entry
+
+    def get(self, content: str) -> Optional[Dict]:
+        """
+        Look up a cached summary
+
+        Args:
+            content: Cleaned article text
+
+        Returns:
+            {'summary_data': ..., 'backend': ...} or None on a miss
+        """
+        key = content_hash(content)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self.hits += 1
+            return copy.deepcopy(entry)
+
+    def put(self, content: str, summary_data: Dict, backend: str):
+        """
+        Store a summary
+
+        Args:
+            content: Cleaned article text the summary was produced from
+            summary_data: The full summary dictionary
+            backend: Name of the backend that produced it
+        """
+        key = content_hash(content)
+        with self._lock:
+            self._entries[key] = {'summary_data': copy.deepcopy(summary_data), 'backend': backend}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+    def reset_stats(self):
+        """Clear the hit/miss counters"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def save(self):
+        """Write the cache to disk if it is persistent and anything changed"""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not save summary cache {self.path}: {str(e)}")
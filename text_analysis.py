@@ -0,0 +1,172 @@
+"""
+Shared text analysis for the Gmail Article Summarizer
+An AnalyzedDocument splits, lowercases and counts an article's text once, and
+the insight, topic, takeaway and relevance analyzers all read from it instead
+of re-splitting the content on their own. AnalysisProfile collects how long
+each step takes per article.
+
+Topic terms are normalized (punctuation stripped, possessives and plurals
+folded), stopwords are dropped, and the top k are picked with a heap,
+optionally weighted by how rare a term is across all articles of the run.
+"""
+import heapq
+import math
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+STOPWORDS = frozenset("""
+a about above according across actually after again against ago all almost along already also
+although always am among an and another any anyone anything are around as ask asked at away back
+be became because become been before being below best better between big both but by call called
+came can cannot come could day days did do does doing done down during each early either else
+end enough even ever every few first for former found four from full further get gets getting
+give given go goes going good got great had has have having he her here hers herself him himself
+his how however i if in including inside instead into is it its itself just know last later
+latest least less let like likely little long look made make makes making many may maybe me
+might more most much must my myself near need never new next no nor not now of off often on
+once one only or other others our ours ourselves out over own part people per put rather really
+right said same saw say says second see seen several she should show since so some something
+still such take than that the their theirs them themselves then there these they thing things
+think this those though three through time times to today told too took two under until up
+upon us use used using very want was way ways we week well went were what when where whether
+which while who whole whom whose why will with within without would year years yet you your
+yours yourself yourselves
+""".split())
+
+_PUNCTUATION = re.compile(r"^[^\w]+|[^\w]+$")
+
+
+def normalize_term(token: str) -> str:
+    """
+    Normalize a lowercase token for counting
+
+    Strips surrounding punctuation ("said," -> "said"), drops possessives
+    ("company's" -> "company") and folds regular plurals ("startups" ->
+    "startup", "companies" -> "company") so the result still reads as a word.
+    """
+    term = token if token.isalnum() else _PUNCTUATION.sub('', token)
+    if term.endswith(("'s", "’s")):
+        term = term[:-2]
+    if len(term) > 4:
+        if term.endswith('ies'):
+            term = term[:-3] + 'y'
+        elif term.endswith('sses'):
+            term = term[:-2]
+        elif term.endswith('s') and not term.endswith(('ss', 'us', 'is', 'ous')):
+            term = term[:-1]
+    return term
+
+
+def top_terms(term_counts: Counter, k: int, document_frequency: Optional[Counter] = None,
+              num_documents: int = 0) -> List[str]:
+    """
+    Pick the k highest scoring terms with a heap instead of sorting the vocabulary
+
+    Args:
+        term_counts: Occurrences of each term in one article
+        k: Number of terms to return
+        document_frequency: Articles of the run containing each term; when given,
+            counts are weighted by inverse document frequency so terms shared by
+            every article rank below the ones distinctive to this one
+        num_documents: Number of articles document_frequency was built from
+
+    Returns:
+        Terms, best first (ties keep first-occurrence order)
+    """
+    if document_frequency and num_documents > 1:
+        def score(item):
+            term, count = item
+            return count * (math.log((1 + num_documents) / (1 + document_frequency[term])) + 1)
+    else:
+        def score(item):
+            return item[1]
+    return [term for term, _ in heapq.nlargest(k, term_counts.items(), key=score)]
+
+
+class AnalyzedDocument:
+    def __init__(self, content: str):
+        """
+        Tokenize an article once
+
+        Args:
+            content: Cleaned article text
+        """
+        self.content = content
+        self.lower = content.lower()
+        # Same '. ' split the analyzers have always used, so their output is unchanged
+        self.sentences: List[str] = content.split('. ')
+        self.lower_sentences: List[str] = self.lower.split('. ')
+        self.tokens: List[str] = self.lower.split()
+        self.word_count = len(self.tokens)
+        self._token_counts = None
+        self._term_counts = None
+
+    @property
+    def token_counts(self) -> Counter:
+        """Occurrences of each lowercase token (built on first use)"""
+        if self._token_counts is None:
+            self._token_counts = Counter(self.tokens)
+        return self._token_counts
+
+    @property
+    def term_counts(self) -> Counter:
+        """Occurrences of each normalized, non-stopword term of 4+ letters (built on first use)"""
+        if self._term_counts is None:
+            terms = Counter()
+            for token, count in self.token_counts.items():
+                term = normalize_term(token)
+                if len(term) > 3 and term not in STOPWORDS and not term.isdigit():
+                    terms[term] += count
+            self._term_counts = terms
+        return self._term_counts
+
+
+def document_frequency(docs: Iterable[AnalyzedDocument]) -> Counter:
+    """Count, for each term, how many of the documents contain it"""
+    frequency = Counter()
+    for doc in docs:
+        frequency.update(doc.term_counts.keys())
+    return frequency
+
+
+class AnalysisProfile:
+    def __init__(self):
+        """Accumulates seconds spent per analysis step across articles"""
+        self._lock = threading.Lock()
+        self._seconds: Dict[str, float] = {}
+        self._articles = 0
+
+    @contextmanager
+    def step(self, name: str):
+        """Time the enclosed block and add it to the named step"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._seconds[name] = self._seconds.get(name, 0.0) + elapsed
+
+    def count_article(self):
+        with self._lock:
+            self._articles += 1
+
+    def report(self) -> Dict[str, float]:
+        """Return average milliseconds per article for each step"""
+        with self._lock:
+            articles = max(1, self._articles)
+            return {name: round(seconds * 1000 / articles, 3) for name, seconds in self._seconds.items()}
+
+    @property
+    def articles(self) -> int:
+        with self._lock:
+            return self._articles
+
+    def reset(self):
+        with self._lock:
+            self._seconds.clear()
+            self._articles = 0